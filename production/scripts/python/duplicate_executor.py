@@ -26,17 +26,25 @@ Date: August 2025
 """
 
 import argparse
+import atexit
 import csv
+import errno
+import hashlib
 import json
 import logging
 import os
 import shutil
 import stat
 import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 
@@ -51,6 +59,85 @@ class ActionType(Enum):
     DELETE_BOTH = "DELETE_BOTH"
 
 
+# Columns in the duplicates CSV: empty, OriginalFolder ... Action, NOTES
+_CSV_COLUMNS = 11
+
+# Number of CSV entries parsed, prefetched and processed together
+_BATCH_SIZE = 256
+
+# Worker threads for validation/backup I/O (same default as ThreadPoolExecutor)
+_DEFAULT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+
+# Rollback journal write buffer; the journal is flushed once per batch
+_JOURNAL_BUFFER = 1 << 20
+
+# fdatasync() skips the metadata flush; not available on every platform
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+# Sampled reads for --paranoid-hardlink-backup: start, middle and end of the file
+_SAMPLE_SIZE = 64 * 1024
+
+
+def _sample_digest(path: str, size: int) -> bytes:
+    """Return a digest of the size and three sampled chunks of a file."""
+    digest = hashlib.blake2b(str(size).encode())
+    with open(path, 'rb') as f:
+        for offset in sorted({0, max(0, size // 2 - _SAMPLE_SIZE // 2), max(0, size - _SAMPLE_SIZE)}):
+            f.seek(offset)
+            digest.update(f.read(_SAMPLE_SIZE))
+    return digest.digest()
+
+
+# Directory-relative (*at) syscalls for the row hot path, where the platform has them
+_DIR_FD_OK = (
+    hasattr(os, 'O_DIRECTORY')
+    and {os.stat, os.unlink, os.symlink, os.link} <= os.supports_dir_fd
+)
+
+# Open directory descriptors kept at most per batch
+_MAX_DIR_FDS = 256
+
+def _link_at(src: Tuple[str, Optional[int]], dst: Tuple[str, Optional[int]]):
+    """os.link() for (name, dir_fd) pairs as returned by DuplicateFileExecutor._at()."""
+    if src[1] is None and dst[1] is None:
+        os.link(src[0], dst[0])
+    else:
+        # follow_symlinks=False keeps link()'s semantics under linkat()
+        os.link(src[0], dst[0], src_dir_fd=src[1], dst_dir_fd=dst[1], follow_symlinks=False)
+
+
+# stat() failures that Path.exists() reports as "does not exist"
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ELOOP})
+
+# os.link() failures that mean "cannot hard link here" rather than a real error
+_LINK_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+
+# CSV action column -> ActionType; None marks rows deliberately left without action
+_ACTION_LOOKUP: Dict[str, Optional[ActionType]] = {member.value: member for member in ActionType}
+_ACTION_LOOKUP[""] = _ACTION_LOOKUP["REVIEW_NEEDED"] = _ACTION_LOOKUP["Action"] = None
+
+# Action groups checked during validation (built once, not per row)
+_ORIGINAL_ACTIONS = frozenset({ActionType.DELETE_ORIGINAL, ActionType.SOFTLINK_ORIGINAL, ActionType.HARDLINK_ORIGINAL})
+_DUPLICATE_ACTIONS = frozenset({ActionType.DELETE_DUPLICATE, ActionType.SOFTLINK_DUPLICATE, ActionType.HARDLINK_DUPLICATE})
+_HARDLINK_ACTIONS = frozenset({ActionType.HARDLINK_ORIGINAL, ActionType.HARDLINK_DUPLICATE})
+
+# Files each action replaces or deletes, as (DuplicateEntry attribute, backup prefix)
+_BACKUP_TARGETS: Dict[ActionType, Tuple[Tuple[str, str], ...]] = {
+    ActionType.SOFTLINK_ORIGINAL: (("original_path", "softlink"),),
+    ActionType.SOFTLINK_DUPLICATE: (("duplicate_path", "softlink"),),
+    ActionType.HARDLINK_ORIGINAL: (("original_path", "hardlink"),),
+    ActionType.HARDLINK_DUPLICATE: (("duplicate_path", "hardlink"),),
+    ActionType.DELETE_ORIGINAL: (("original_path", "deleted"),),
+    ActionType.DELETE_DUPLICATE: (("duplicate_path", "deleted"),),
+    ActionType.DELETE_BOTH: (("original_path", "deleted"), ("duplicate_path", "deleted")),
+}
+
+# Marker for action strings that are neither an ActionType nor a known no-op
+_UNKNOWN_ACTION = object()
+
+
 class ValidationResult(Enum):
     """File validation results."""
     SUCCESS = 0
@@ -58,7 +145,7 @@ class ValidationResult(Enum):
     CROSS_DEVICE = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateEntry:
     """Represents a duplicate file entry from CSV."""
     row_num: int
@@ -72,17 +159,32 @@ class DuplicateEntry:
     keep_dup: str
     action: str
     notes: str = ""
+    action_enum: object = field(default=None, init=False, repr=False, compare=False)
+    original_path: str = field(default="", init=False, repr=False, compare=False)
+    duplicate_path: str = field(default="", init=False, repr=False, compare=False)
     
-    @property
-    def original_path(self) -> Path:
-        return Path(self.original_folder) / self.original_file
-    
-    @property
-    def duplicate_path(self) -> Path:
-        return Path(self.duplicate_folder) / self.duplicate_file
+    def __post_init__(self):
+        # Resolve the action once at parse time: ActionType, None or _UNKNOWN_ACTION
+        self.action_enum = _ACTION_LOOKUP.get(self.action, _UNKNOWN_ACTION)
+        # Join paths once; the hot path works on plain strings
+        self.original_path = os.path.join(self.original_folder, self.original_file)
+        self.duplicate_path = os.path.join(self.duplicate_folder, self.duplicate_file)
 
 
-@dataclass
+@dataclass(slots=True)
+class PreparedOp:
+    """Validation result, validated stats (path -> stat or None) and staged
+    backups (path -> (name, st_dev)) for an entry."""
+    validation: ValidationResult
+    stats: Dict[str, Optional[os.stat_result]] = field(default_factory=dict)
+    backups: Dict[str, Tuple[str, Optional[int]]] = field(default_factory=dict)
+    # Hard links only: whether the kept source stands in for the target's backup
+    source_backed: Optional[bool] = None
+    # Hard links only: the row has a Hash and its Size matches both files on disk
+    csv_matches: bool = False
+
+
+@dataclass(slots=True)
 class OperationStats:
     """Statistics for file operations."""
     total_rows: int = 0
@@ -94,7 +196,7 @@ class OperationStats:
     skipped: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RollbackEntry:
     """Entry for rollback operations."""
     timestamp: str
@@ -103,14 +205,66 @@ class RollbackEntry:
     target_path: str
     backup_path: str
     status: str = "active"
+    backup_dev: Optional[int] = None
+
+
+# Log formatters, shared by every executor instance
+_FILE_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_CONSOLE_FORMATTER = logging.Formatter('%(levelname)s - %(message)s')
+
+
+class BatchedFileHandler(logging.FileHandler):
+    """FileHandler that flushes every `capacity` records or `interval` seconds.
+    
+    FileHandler flushes after each record, one write() per log line.
+    Records at `flush_level` (at most ERROR) or above are still flushed
+    immediately. The interval is only checked on logging, so the executor
+    flushes before slow steps (see DuplicateFileExecutor._flush_log).
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, capacity: int = 256,
+                 interval: float = 0.5, flush_level: int = logging.WARNING):
+        super().__init__(filename, mode=mode, encoding=encoding)
+        self.capacity = capacity
+        self.interval = interval
+        self.flush_level = flush_level
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._in_emit = False
+    
+    def emit(self, record):
+        # StreamHandler.emit() flushes after every write; defer that here
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+        
+        self._pending += 1
+        if (self._pending >= self.capacity or record.levelno >= min(self.flush_level, logging.ERROR)
+                or time.monotonic() - self._last_flush >= self.interval):
+            self.flush()
+    
+    def flush(self):
+        if self._in_emit:
+            return
+        super().flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
 
 
 class DuplicateFileExecutor:
     """Main class for executing duplicate file actions."""
     
-    def __init__(self, dry_run: bool = False, verbose: bool = False):
+    def __init__(self, dry_run: bool = False, verbose: bool = False,
+                 delimiter: Optional[str] = None, jobs: int = _DEFAULT_JOBS,
+                 sync_rollback: bool = False, paranoid_hardlink_backup: bool = False):
         self.dry_run = dry_run
         self.verbose = verbose
+        self.delimiter = delimiter
+        self.jobs = max(1, jobs)
+        self.sync_rollback = sync_rollback
+        self.paranoid_hardlink_backup = paranoid_hardlink_backup
         self.stats = OperationStats()
         
         # Setup directories
@@ -118,13 +272,51 @@ class DuplicateFileExecutor:
         self.backup_dir = self.base_dir / "duplicate_backups" / datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.base_dir / "duplicate_actions.log"
         self.rollback_file = self.base_dir / "duplicate_rollback.json"
+        self.rollback_journal = self.backup_dir / "duplicate_rollback.ndjson"
+        self.rollback_meta = self.rollback_journal.with_suffix(".meta.json")
         
-        # Rollback entries
-        self.rollback_entries: List[RollbackEntry] = []
+        # Rollback entries are streamed to the journal; only their count is kept
+        self.rollback_count = 0
+        
+        # Wall-clock cache for per-operation timestamps and backup name counter
+        self._now_cache: Optional[Tuple[float, str, str]] = None
+        self._backup_seq = 0
+        
+        # Worker pool for validation/backup I/O (see _process_batch_parallel)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        
+        # Memoized filesystem state (paths recur heavily across duplicate rows)
+        self._stat_cache: Dict[str, Optional[os.stat_result]] = {}
+        self._dir_w_ok: Dict[str, bool] = {}
+        self._real_dirs: Dict[str, str] = {}
+        self._dev_cache: Dict[str, Optional[int]] = {}
+        # Resolved directory -> open O_DIRECTORY fd (-1 if it could not be opened)
+        self._dir_fds: Dict[str, int] = {}
+        
+        # Action handlers, one lookup per row instead of an if/elif chain
+        # (each handler gets the entry and its PreparedOp from validation)
+        self._dispatch: Dict[ActionType, Callable[[DuplicateEntry, PreparedOp], bool]] = {
+            # Keep duplicate, link original to it
+            ActionType.SOFTLINK_ORIGINAL: lambda e, p: self.execute_soft_link(e.duplicate_path, e.original_path, "original", p),
+            # Keep original, link duplicate to it
+            ActionType.SOFTLINK_DUPLICATE: lambda e, p: self.execute_soft_link(e.original_path, e.duplicate_path, "duplicate", p),
+            # Keep duplicate, hard link original to it
+            ActionType.HARDLINK_ORIGINAL: lambda e, p: self.execute_hard_link(e.duplicate_path, e.original_path, "original", p),
+            # Keep original, hard link duplicate to it
+            ActionType.HARDLINK_DUPLICATE: lambda e, p: self.execute_hard_link(e.original_path, e.duplicate_path, "duplicate", p),
+            # Delete original, keep duplicate
+            ActionType.DELETE_ORIGINAL: lambda e, p: self.execute_delete(e.original_path, "original", p),
+            # Delete duplicate, keep original
+            ActionType.DELETE_DUPLICATE: lambda e, p: self.execute_delete(e.duplicate_path, "duplicate", p),
+            ActionType.DELETE_BOTH: self._delete_both,
+        }
         
         # Setup logging
         self._setup_logging()
         self._setup_directories()
+        self._open_rollback_journal()
+        atexit.register(self._final_flush)
     
     def _setup_logging(self):
         """Initialize logging configuration."""
@@ -133,44 +325,111 @@ class DuplicateFileExecutor:
         
         # Configure logging
         log_level = logging.DEBUG if self.verbose else logging.INFO
-        
-        # File handler
-        file_handler = logging.FileHandler(self.log_file, mode='a', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_formatter = logging.Formatter('%(levelname)s - %(message)s')
-        console_handler.setFormatter(console_formatter)
-        
-        # Configure logger
         self.logger = logging.getLogger('DuplicateExecutor')
-        self.logger.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        
+        if self.logger.handlers:
+            # Logger already configured by an earlier executor; only adjust verbosity
+            for handler in self.logger.handlers:
+                if not isinstance(handler, logging.FileHandler):
+                    handler.setLevel(log_level)
+        else:
+            # File handler
+            file_handler = BatchedFileHandler(self.log_file, mode='a', encoding='utf-8')
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(_FILE_FORMATTER)
+            
+            # Console handler
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            
+            # Configure logger; records are not passed on to the root logger
+            self.logger.setLevel(logging.DEBUG)
+            self.logger.propagate = False
+            self.logger.addHandler(file_handler)
+            self.logger.addHandler(console_handler)
         
         # Log session start
         self.logger.info("=" * 60)
         self.logger.info("Duplicate File Action Executor - Session Start")
-        self.logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'EXECUTE'}")
-        self.logger.info(f"Verbose: {self.verbose}")
+        self.logger.info("Mode: %s", 'DRY RUN' if self.dry_run else 'EXECUTE')
+        self.logger.info("Verbose: %s", self.verbose)
     
     def _setup_directories(self):
         """Create necessary directories."""
-        self.logger.info(f"Duplicates handling directory: {self.base_dir}")
+        self.logger.info("Duplicates handling directory: %s", self.base_dir)
         
         if not self.dry_run:
-            self.backup_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Backup directory created: {self.backup_dir}")
+            # The name has one-second resolution; a session started in the
+            # same second gets its own directory so journals never mix
+            self.backup_dir.parent.mkdir(parents=True, exist_ok=True)
+            session_dir = self.backup_dir
+            suffix = 0
+            while True:
+                try:
+                    self.backup_dir.mkdir()
+                    break
+                except FileExistsError:
+                    suffix += 1
+                    self.backup_dir = session_dir.with_name(f"{session_dir.name}_{suffix}")
+            self.rollback_journal = self.backup_dir / "duplicate_rollback.ndjson"
+            self.rollback_meta = self.rollback_journal.with_suffix(".meta.json")
+            self.logger.info("Backup directory created: %s", self.backup_dir)
         else:
             self.logger.info("DRY RUN mode - backup directory will not be created")
     
+    def _open_rollback_journal(self):
+        """Open the per-session NDJSON rollback journal and write its metadata."""
+        self._rollback_fp = None
+        if self.dry_run:
+            return
+        
+        meta = {
+            "timestamp": datetime.now().isoformat(),
+            "dry_run": self.dry_run,
+            "backup_directory": str(self.backup_dir)
+        }
+        with open(self.rollback_meta, 'x', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+        
+        # Large buffer: records reach the OS once per batch (or per op with --sync-rollback)
+        self._rollback_fp = open(self.rollback_journal, 'x', encoding='utf-8', buffering=_JOURNAL_BUFFER)
+        self.logger.info("Rollback journal: %s", self.rollback_journal)
+    
+    def _record_rollback(self, entry: RollbackEntry):
+        """Append a rollback entry to the journal as soon as the operation is done."""
+        self.rollback_count += 1
+        self._rollback_fp.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+        if self.sync_rollback:
+            self._rollback_fp.flush()
+            _fdatasync(self._rollback_fp.fileno())
+    
+    def _now(self) -> Tuple[str, str]:
+        """Return (ISO timestamp, HHMMSS), re-reading the clock at most every half second."""
+        mono = time.monotonic()
+        if self._now_cache is None or mono - self._now_cache[0] > 0.5:
+            now = datetime.now()
+            self._now_cache = (mono, now.isoformat(), now.strftime('%H%M%S'))
+        return self._now_cache[1], self._now_cache[2]
+    
+    def _close_rollback_journal(self):
+        """Flush, sync and close the rollback journal, if one is open."""
+        if self._rollback_fp is not None:
+            self._rollback_fp.flush()
+            os.fsync(self._rollback_fp.fileno())
+            self._rollback_fp.close()
+            self._rollback_fp = None
+    
+    def _final_flush(self):
+        """Make the journal and log durable at interpreter exit, even after an error."""
+        self._close_rollback_journal()
+        self._flush_log()
+    
+    def _flush_log(self):
+        """Write out log lines still buffered by the log file handler."""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
     def check_prerequisites(self) -> bool:
         """Check system prerequisites."""
         self.logger.info("Checking system prerequisites...")
@@ -181,272 +440,589 @@ class DuplicateFileExecutor:
             test_file.touch()
             test_file.unlink()
         except (PermissionError, OSError) as e:
-            self.logger.error(f"Cannot write to handling directory {self.base_dir}: {e}")
+            self.logger.error("Cannot write to handling directory %s: %s", self.base_dir, e)
             return False
         
-        # Check Python version
-        if sys.version_info < (3, 6):
-            self.logger.error(f"Python 3.6+ required, found {sys.version}")
+        # Check Python version (dataclass slots need 3.10)
+        if sys.version_info < (3, 10):
+            self.logger.error("Python 3.10+ required, found %s", sys.version)
             return False
         
         self.logger.info("Prerequisites check passed")
         return True
     
-    def validate_file_paths(self, entry: DuplicateEntry, action: ActionType) -> ValidationResult:
-        """Validate file paths and permissions."""
+    def _canonical(self, path: str) -> str:
+        """Return path with its directory resolved, so aliases share one cache key."""
+        directory, name = os.path.split(path)
+        real_dir = self._real_dirs.get(directory)
+        if real_dir is None:
+            real_dir = self._real_dirs[directory] = os.path.realpath(directory)
+        return os.path.join(real_dir, name)
+    
+    def _at(self, path: str) -> Tuple[str, Optional[int]]:
+        """Split path into (name, dir_fd) for a directory-relative syscall.
+        
+        Returns (path, None) when *at syscalls are unavailable or the parent
+        directory cannot be opened, which makes the os.* call path-based.
+        """
+        directory, name = os.path.split(path)
+        if not _DIR_FD_OK or not name:
+            return path, None
+        
+        real_dir = self._real_dirs.get(directory)
+        if real_dir is None:
+            real_dir = self._real_dirs[directory] = os.path.realpath(directory)
+        fd = self._dir_fds.get(real_dir)
+        if fd is None:
+            with self._lock:
+                fd = self._dir_fds.get(real_dir)
+                if fd is None:
+                    if len(self._dir_fds) >= _MAX_DIR_FDS:
+                        return path, None
+                    try:
+                        fd = os.open(real_dir, os.O_RDONLY | os.O_DIRECTORY)
+                    except OSError:
+                        fd = -1
+                    self._dir_fds[real_dir] = fd
+        return (name, fd) if fd >= 0 else (path, None)
+    
+    def _close_dir_fds(self):
+        """Close the directory descriptors opened by _at()."""
+        for fd in self._dir_fds.values():
+            if fd >= 0:
+                os.close(fd)
+        self._dir_fds.clear()
+    
+    def _cached_stat(self, path: Union[str, Path]) -> Optional[os.stat_result]:
+        """Return the (memoized) stat result for a path, or None if it does not exist.
+        
+        Like Path.exists(), symlinks are followed and dangling or looping links
+        count as missing. Symlinks are never cached, since their result depends
+        on a target that other rows may change.
+        """
+        key = self._canonical(str(path))
+        if key in self._stat_cache:
+            return self._stat_cache[key]
+        
+        name, dir_fd = self._at(key)
+        try:
+            st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+        except OSError as e:
+            if e.errno not in _MISSING_ERRNOS:
+                raise
+            st = None
+        else:
+            if stat.S_ISLNK(st.st_mode):
+                try:
+                    return os.stat(name, dir_fd=dir_fd)
+                except OSError as e:
+                    if e.errno not in _MISSING_ERRNOS:
+                        raise
+                    return None
+        
+        self._stat_cache[key] = st
+        return st
+    
+    def _dir_writable(self, directory: Union[str, Path]) -> bool:
+        """Return (memoized) write permission for a directory."""
+        key = str(directory)
+        if key not in self._dir_w_ok:
+            self._dir_w_ok[key] = os.access(key, os.W_OK)
+        return self._dir_w_ok[key]
+    
+    def _dev_of(self, directory: str) -> Optional[int]:
+        """Return (memoized) st_dev of a directory, or None if it does not exist.
+        
+        Keyed by the resolved directory, since a directory's device does not
+        change while it exists. Ancestors are not assumed to share it: bind
+        mounts and btrfs subvolumes give nested directories their own st_dev.
+        """
+        real_dir = self._real_dirs.get(directory)
+        if real_dir is None:
+            real_dir = self._real_dirs[directory] = os.path.realpath(directory)
+        try:
+            return self._dev_cache[real_dir]
+        except KeyError:
+            pass
+        
+        try:
+            dev = os.stat(real_dir).st_dev
+        except OSError as e:
+            if e.errno not in _MISSING_ERRNOS:
+                raise
+            return None  # Not cached; the directory may still be created
+        self._dev_cache[real_dir] = dev
+        return dev
+    
+    def _prefetch_stat(self, path: str):
+        """Warm the stat cache for one path, leaving errors to validation."""
+        try:
+            self._cached_stat(path)
+        except OSError:
+            pass  # Not cached; validation reports it for the affected row
+    
+    def _prefetch_stats(self, entries: List[DuplicateEntry]):
+        """Warm the stat cache for every path a batch of entries will touch.
+        
+        Unique paths are collected first and stat'ed in sorted order, so each
+        file is probed exactly once and neighbouring entries of the same
+        directory are visited together. Directories are not prefetched:
+        nothing reads their stat from the cache.
+        """
+        paths = set()
+        for entry in entries:
+            paths.add(entry.original_path)
+            paths.add(entry.duplicate_path)
+        
+        if self._pool is not None:
+            list(self._pool.map(self._prefetch_stat, sorted(paths)))
+        else:
+            for path in sorted(paths):
+                self._prefetch_stat(path)
+        
+        self.logger.debug("Prefetched stat info for %d paths", len(paths))
+    
+    def _forget(self, path: Union[str, Path], prepared: Optional[PreparedOp] = None):
+        """Drop cached stat results after the path has been modified.
+        
+        The stats validated for the entry are dropped as a whole, since the
+        entry's two paths may alias each other.
+        """
+        self._stat_cache.pop(self._canonical(str(path)), None)
+        if prepared is not None:
+            prepared.stats.clear()
+    
+    def _validated_stat(self, path: str, prepared: Optional[PreparedOp]) -> Optional[os.stat_result]:
+        """Return the stat validated for path, falling back to the stat cache."""
+        if prepared is not None and path in prepared.stats:
+            return prepared.stats[path]
+        return self._cached_stat(path)
+    
+    @staticmethod
+    def _staged_backup(path: str, prepared: Optional[PreparedOp]) -> Optional[Tuple[str, Optional[int]]]:
+        """Return the backup staged for path by _prepare_entry, if any."""
+        return prepared.backups.get(path) if prepared is not None else None
+    
+    def validate_file_paths(self, entry: DuplicateEntry, action: ActionType) -> PreparedOp:
+        """Validate file paths and permissions, keeping the stat results for execution."""
         orig_path = entry.original_path
         dup_path = entry.duplicate_path
+        orig_dir = os.path.dirname(orig_path)
+        dup_dir = os.path.dirname(dup_path)
+        
+        # One file listed on both sides, e.g. through a symlinked folder:
+        # acting on the "duplicate" would also remove the original
+        if self._canonical(orig_path) == self._canonical(dup_path):
+            self.logger.error("Original and duplicate are the same file: %s, %s", orig_path, dup_path)
+            return PreparedOp(ValidationResult.ERROR)
         
         # Check file existence based on action requirements
         try:
-            if action in [ActionType.DELETE_ORIGINAL, ActionType.SOFTLINK_ORIGINAL, ActionType.HARDLINK_ORIGINAL]:
-                if not orig_path.exists():
-                    self.logger.error(f"Original file not found: {orig_path}")
-                    return ValidationResult.ERROR
-                if not dup_path.exists():
-                    self.logger.error(f"Duplicate file not found: {dup_path}")
-                    return ValidationResult.ERROR
+            orig_stat = self._cached_stat(orig_path)
+            dup_stat = self._cached_stat(dup_path)
             
-            elif action in [ActionType.DELETE_DUPLICATE, ActionType.SOFTLINK_DUPLICATE, ActionType.HARDLINK_DUPLICATE]:
-                if not orig_path.exists():
-                    self.logger.error(f"Original file not found: {orig_path}")
-                    return ValidationResult.ERROR
-                if not dup_path.exists():
-                    self.logger.error(f"Duplicate file not found: {dup_path}")
-                    return ValidationResult.ERROR
+            if action in _ORIGINAL_ACTIONS:
+                if orig_stat is None:
+                    self.logger.error("Original file not found: %s", orig_path)
+                    return PreparedOp(ValidationResult.ERROR)
+                if dup_stat is None:
+                    self.logger.error("Duplicate file not found: %s", dup_path)
+                    return PreparedOp(ValidationResult.ERROR)
             
-            elif action == ActionType.DELETE_BOTH:
-                if not orig_path.exists() and not dup_path.exists():
-                    self.logger.error(f"Neither file exists: {orig_path}, {dup_path}")
-                    return ValidationResult.ERROR
+            elif action in _DUPLICATE_ACTIONS:
+                if orig_stat is None:
+                    self.logger.error("Original file not found: %s", orig_path)
+                    return PreparedOp(ValidationResult.ERROR)
+                if dup_stat is None:
+                    self.logger.error("Duplicate file not found: %s", dup_path)
+                    return PreparedOp(ValidationResult.ERROR)
+            
+            elif action is ActionType.DELETE_BOTH:
+                if orig_stat is None and dup_stat is None:
+                    self.logger.error("Neither file exists: %s, %s", orig_path, dup_path)
+                    return PreparedOp(ValidationResult.ERROR)
             
             # Check write permissions for directories
-            if orig_path.exists() and not os.access(orig_path.parent, os.W_OK):
-                self.logger.error(f"No write permission for directory: {orig_path.parent}")
-                return ValidationResult.ERROR
+            if orig_stat is not None and not self._dir_writable(orig_dir):
+                self.logger.error("No write permission for directory: %s", orig_dir)
+                return PreparedOp(ValidationResult.ERROR)
             
-            if dup_path.exists() and not os.access(dup_path.parent, os.W_OK):
-                self.logger.error(f"No write permission for directory: {dup_path.parent}")
-                return ValidationResult.ERROR
+            if dup_stat is not None and not self._dir_writable(dup_dir):
+                self.logger.error("No write permission for directory: %s", dup_dir)
+                return PreparedOp(ValidationResult.ERROR)
             
             # For hard links, check if files are on same filesystem
-            if action in [ActionType.HARDLINK_ORIGINAL, ActionType.HARDLINK_DUPLICATE]:
-                try:
-                    orig_stat = orig_path.stat()
-                    dup_stat = dup_path.parent.stat()
-                    
-                    if orig_stat.st_dev != dup_stat.st_dev:
-                        self.logger.warning(f"Files on different filesystems, hard link not possible: {orig_path} <-> {dup_path}")
-                        return ValidationResult.CROSS_DEVICE
-                except OSError as e:
-                    self.logger.error(f"Cannot check filesystem info: {e}")
-                    return ValidationResult.ERROR
+            if action in _HARDLINK_ACTIONS:
+                dup_dev = self._dev_of(dup_dir)
+                if dup_dev is None:
+                    self.logger.error("Cannot check filesystem info: directory not found: %s", dup_dir)
+                    return PreparedOp(ValidationResult.ERROR)
+                
+                if orig_stat.st_dev != dup_dev:
+                    self.logger.warning("Files on different filesystems, hard link not possible: %s <-> %s", orig_path, dup_path)
+                    return PreparedOp(ValidationResult.CROSS_DEVICE)
             
         except OSError as e:
-            self.logger.error(f"File system error during validation: {e}")
-            return ValidationResult.ERROR
+            self.logger.error("File system error during validation: %s", e)
+            return PreparedOp(ValidationResult.ERROR)
         
-        return ValidationResult.SUCCESS
+        prepared = PreparedOp(ValidationResult.SUCCESS, {orig_path: orig_stat, dup_path: dup_stat})
+        if action in _HARDLINK_ACTIONS:
+            prepared.csv_matches = self._csv_matches(entry, orig_stat, dup_stat)
+        return prepared
     
-    def create_backup(self, file_path: Path, backup_name: str) -> bool:
-        """Create a backup of a file."""
+    def _csv_matches(self, entry: DuplicateEntry, orig_stat: os.stat_result,
+                     dup_stat: os.stat_result) -> bool:
+        """Return True if the row's Hash is set and its Size matches both files on disk.
+        
+        A stale or mis-paired CSV fails this, and the hard link target then
+        gets a real backup instead of relying on the kept file.
+        """
+        try:
+            csv_size = int(entry.size)
+        except ValueError:
+            csv_size = None
+        if not entry.hash_value or csv_size != orig_stat.st_size or csv_size != dup_stat.st_size:
+            self.logger.warning("Row %d: CSV Size/Hash (%s, %s) do not match the files on disk (%d, %d bytes)",
+                                entry.row_num, entry.size or '-', entry.hash_value or '-',
+                                orig_stat.st_size, dup_stat.st_size)
+            return False
+        return True
+    
+    def create_backup(self, file_path: str, backup_name: str) -> Tuple[bool, Optional[int]]:
+        """Create a backup of a file.
+        
+        A regular file is hard linked into the backup directory when both
+        live on the same filesystem (no data is copied). Anything else, such
+        as a symlink, is copied so the backup holds the data it points to.
+        Returns a success flag and the st_dev of the backup, if one was made.
+        """
         if self.dry_run:
-            self.logger.info(f"[DRY-RUN] Would backup: {file_path} -> {self.backup_dir}/{backup_name}")
-            return True
+            self.logger.info("[DRY-RUN] Would backup: %s -> %s/%s", file_path, self.backup_dir, backup_name)
+            return True, None
         
-        if not file_path.exists():
-            return True  # Nothing to backup
+        file_stat = self._cached_stat(file_path)
+        if file_stat is None:
+            return True, None  # Nothing to backup
         
+        backup_path = os.path.join(self.backup_dir, backup_name)
+        source = self._at(file_path)
+        try:
+            # file_stat follows symlinks; only link the path if it is the file
+            if stat.S_ISREG(os.stat(source[0], dir_fd=source[1], follow_symlinks=False).st_mode):
+                _link_at(source, self._at(backup_path))
+                self.logger.info("Backup created (hard link): %s", backup_name)
+                return True, file_stat.st_dev
+        except OSError as e:
+            if e.errno not in _LINK_FALLBACK_ERRNOS:
+                self.logger.error("Failed to create backup for %s: %s", file_path, e)
+                return False, None
+        
+        # A copy can take long; do not leave earlier lines waiting behind it
+        self._flush_log()
         try:
-            backup_path = self.backup_dir / backup_name
             shutil.copy2(file_path, backup_path)
-            self.logger.info(f"Backup created: {backup_name}")
-            return True
+            self.logger.info("Backup created: %s", backup_name)
+            return True, self._dev_of(str(self.backup_dir))
         except (OSError, shutil.Error) as e:
-            self.logger.error(f"Failed to create backup for {file_path}: {e}")
-            return False
+            self.logger.error("Failed to create backup for %s: %s", file_path, e)
+            return False, None
+    
+    def _new_backup_name(self, prefix: str, file_path: str) -> str:
+        """Return a unique backup file name for file_path."""
+        _, hhmmss = self._now()
+        with self._lock:
+            self._backup_seq += 1
+            seq = self._backup_seq
+        return f"{prefix}_{os.path.basename(file_path)}_{hhmmss}_{seq}"
     
-    def execute_soft_link(self, source_file: Path, target_file: Path, action_type: str) -> bool:
-        """Create a soft link."""
+    def _ensure_backup(self, file_path: str, prefix: str,
+                       staged: Optional[Tuple[str, Optional[int]]] = None) -> Optional[Tuple[str, Optional[int]]]:
+        """Return (backup_name, backup_dev) for file_path, creating the backup unless one was staged."""
+        if staged is not None:
+            return staged
+        
+        backup_name = self._new_backup_name(prefix, file_path)
+        backup_ok, backup_dev = self.create_backup(file_path, backup_name)
+        return (backup_name, backup_dev) if backup_ok else None
+    
+    def execute_soft_link(self, source_file: str, target_file: str, action_type: str,
+                          prepared: Optional[PreparedOp] = None) -> bool:
+        """Create a soft link.
+        
+        `prepared` carries the stats and staged backups from validation.
+        """
         if self.dry_run:
-            self.logger.info(f"[DRY-RUN] Would create soft link: {target_file} -> {source_file}")
+            self.logger.info("[DRY-RUN] Would create soft link: %s -> %s", target_file, source_file)
             return True
         
+        backup_name = None
         try:
             # Create backup of target before replacing with link
-            backup_name = f"softlink_{target_file.name}_{datetime.now().strftime('%H%M%S')}"
-            if not self.create_backup(target_file, backup_name):
+            timestamp, _ = self._now()
+            backup = self._ensure_backup(target_file, "softlink", self._staged_backup(target_file, prepared))
+            if backup is None:
                 return False
+            backup_name, backup_dev = backup
             
             # Remove target and create soft link
-            if target_file.exists():
-                target_file.unlink()
+            target_name, target_fd = self._at(target_file)
+            try:
+                os.unlink(target_name, dir_fd=target_fd)
+            except FileNotFoundError:
+                pass
+            self._forget(target_file, prepared)
             
-            target_file.symlink_to(source_file)
+            os.symlink(source_file, target_name, dir_fd=target_fd)
             
             # Log rollback entry
             rollback_entry = RollbackEntry(
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
                 operation_type="softlink",
-                original_path=str(source_file),
-                target_path=str(target_file),
-                backup_path=str(self.backup_dir / backup_name)
+                original_path=source_file,
+                target_path=target_file,
+                backup_path=os.path.join(self.backup_dir, backup_name),
+                backup_dev=backup_dev
             )
-            self.rollback_entries.append(rollback_entry)
+            self._record_rollback(rollback_entry)
             
-            self.logger.info(f"Soft link created: {target_file} -> {source_file}")
+            self.logger.info("Soft link created: %s -> %s", target_file, source_file)
             self.stats.softlinks_created += 1
             return True
             
         except OSError as e:
-            self.logger.error(f"Failed to create soft link {target_file} -> {source_file}: {e}")
+            self.logger.error("Failed to create soft link %s -> %s: %s", target_file, source_file, e)
             # Try to restore from backup if it exists
-            backup_path = self.backup_dir / backup_name
-            if backup_path.exists():
+            backup_path = os.path.join(self.backup_dir, backup_name) if backup_name is not None else None
+            if backup_path is not None and os.path.exists(backup_path):
                 try:
                     shutil.copy2(backup_path, target_file)
+                    self._forget(target_file)
                     self.logger.info("Restored target file from backup")
                 except Exception as restore_error:
-                    self.logger.error(f"Failed to restore backup: {restore_error}")
+                    self.logger.error("Failed to restore backup: %s", restore_error)
             return False
     
-    def execute_hard_link(self, source_file: Path, target_file: Path, action_type: str) -> bool:
-        """Create a hard link."""
+    def execute_hard_link(self, source_file: str, target_file: str, action_type: str,
+                          prepared: Optional[PreparedOp] = None) -> bool:
+        """Create a hard link.
+        
+        `prepared` carries the stats and staged backups from validation.
+        The target is not backed up when the kept source file already holds
+        its content; the rollback entry then points at the source.
+        """
         if self.dry_run:
-            self.logger.info(f"[DRY-RUN] Would create hard link: {target_file} -> {source_file}")
+            self.logger.info("[DRY-RUN] Would create hard link: %s -> %s", target_file, source_file)
             return True
         
+        backup_path = None
         try:
-            # Create backup of target before replacing with link
-            backup_name = f"hardlink_{target_file.name}_{datetime.now().strftime('%H%M%S')}"
-            if not self.create_backup(target_file, backup_name):
-                return False
+            timestamp, _ = self._now()
+            if prepared is not None and prepared.source_backed is not None:
+                source_backed = prepared.source_backed
+            else:
+                source_backed = self._source_preserves(source_file, target_file, prepared)
+            
+            if source_backed:
+                backup_path = source_file
+                backup_dev = self._validated_stat(source_file, prepared).st_dev
+            else:
+                # Create backup of target before replacing with link
+                backup = self._ensure_backup(target_file, "hardlink", self._staged_backup(target_file, prepared))
+                if backup is None:
+                    return False
+                backup_name, backup_dev = backup
+                backup_path = os.path.join(self.backup_dir, backup_name)
             
             # Remove target and create hard link
-            if target_file.exists():
-                target_file.unlink()
+            target_name, target_fd = self._at(target_file)
+            try:
+                os.unlink(target_name, dir_fd=target_fd)
+            except FileNotFoundError:
+                pass
+            self._forget(target_file, prepared)
             
-            target_file.hardlink_to(source_file)
+            _link_at(self._at(source_file), (target_name, target_fd))
+            self._forget(source_file, prepared)
             
             # Log rollback entry
             rollback_entry = RollbackEntry(
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
                 operation_type="hardlink",
-                original_path=str(source_file),
-                target_path=str(target_file),
-                backup_path=str(self.backup_dir / backup_name)
+                original_path=source_file,
+                target_path=target_file,
+                backup_path=backup_path,
+                backup_dev=backup_dev
             )
-            self.rollback_entries.append(rollback_entry)
+            self._record_rollback(rollback_entry)
             
-            self.logger.info(f"Hard link created: {target_file} -> {source_file}")
+            self.logger.info("Hard link created: %s -> %s", target_file, source_file)
             self.stats.hardlinks_created += 1
             return True
             
         except OSError as e:
-            self.logger.error(f"Failed to create hard link {target_file} -> {source_file}: {e}")
-            # Try to restore from backup if it exists
-            backup_path = self.backup_dir / backup_name
-            if backup_path.exists():
+            self.logger.error("Failed to create hard link %s -> %s: %s", target_file, source_file, e)
+            # Try to restore from backup if the target is gone
+            if backup_path is not None and os.path.exists(backup_path) and not os.path.lexists(target_file):
                 try:
                     shutil.copy2(backup_path, target_file)
+                    self._forget(target_file)
                     self.logger.info("Restored target file from backup")
                 except Exception as restore_error:
-                    self.logger.error(f"Failed to restore backup: {restore_error}")
+                    self.logger.error("Failed to restore backup: %s", restore_error)
+            return False
+    
+    def _source_preserves(self, source_file: str, target_file: str,
+                          prepared: Optional[PreparedOp] = None) -> bool:
+        """Return True if the hard link source can stand in for a backup of the target.
+        
+        The CSV pairs files by content hash, so by default the row's Size and
+        Hash must agree with the files on disk and the sizes must match. With
+        --paranoid-hardlink-backup sampled content is compared too. Both are
+        heuristics: differences outside the sampled windows go unnoticed.
+        """
+        if prepared is None or not prepared.csv_matches:
+            return False  # Nothing vouches for the pairing; take a real backup
+        if os.path.islink(source_file) or os.path.islink(target_file):
+            return False  # The link may resolve to the target itself; take a real backup
+        if self._canonical(source_file) == self._canonical(target_file):
+            return False  # One entry under two names; unlinking the target removes the source
+        
+        source_stat = self._validated_stat(source_file, prepared)
+        target_stat = self._validated_stat(target_file, prepared)
+        if source_stat is None or target_stat is None:
+            return False
+        if (source_stat.st_dev, source_stat.st_ino) == (target_stat.st_dev, target_stat.st_ino):
+            return True  # Distinct entries already sharing the inode
+        if source_stat.st_size != target_stat.st_size:
+            self.logger.warning("Size mismatch, backing up hard link target: %s (%d) vs %s (%d)",
+                                source_file, source_stat.st_size, target_file, target_stat.st_size)
             return False
+        if self.paranoid_hardlink_backup:
+            try:
+                same = _sample_digest(source_file, source_stat.st_size) == _sample_digest(target_file, target_stat.st_size)
+            except OSError as e:
+                self.logger.warning("Cannot compare %s and %s: %s", source_file, target_file, e)
+                return False
+            if not same:
+                self.logger.warning("Content mismatch, backing up hard link target: %s vs %s", source_file, target_file)
+                return False
+        return True
     
-    def execute_delete(self, file_path: Path, file_type: str) -> bool:
-        """Delete a file with backup."""
+    def execute_delete(self, file_path: str, file_type: str,
+                       prepared: Optional[PreparedOp] = None) -> bool:
+        """Delete a file with backup.
+        
+        `prepared` carries the stats and staged backups from validation.
+        """
         if self.dry_run:
-            self.logger.info(f"[DRY-RUN] Would delete {file_type}: {file_path}")
+            self.logger.info("[DRY-RUN] Would delete %s: %s", file_type, file_path)
             return True
         
-        if not file_path.exists():
-            self.logger.warning(f"File to delete does not exist: {file_path}")
+        if self._validated_stat(file_path, prepared) is None:
+            self.logger.warning("File to delete does not exist: %s", file_path)
             return True  # Consider this successful since the end result is the same
         
         try:
             # Create backup before deletion
-            backup_name = f"deleted_{file_path.name}_{datetime.now().strftime('%H%M%S')}"
-            if not self.create_backup(file_path, backup_name):
+            timestamp, _ = self._now()
+            backup = self._ensure_backup(file_path, "deleted", self._staged_backup(file_path, prepared))
+            if backup is None:
                 return False
+            backup_name, backup_dev = backup
             
             # Delete the file
-            file_path.unlink()
+            name, dir_fd = self._at(file_path)
+            os.unlink(name, dir_fd=dir_fd)
+            self._forget(file_path, prepared)
             
             # Log rollback entry
             rollback_entry = RollbackEntry(
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
                 operation_type="delete",
-                original_path=str(file_path),
+                original_path=file_path,
                 target_path="",
-                backup_path=str(self.backup_dir / backup_name)
+                backup_path=os.path.join(self.backup_dir, backup_name),
+                backup_dev=backup_dev
             )
-            self.rollback_entries.append(rollback_entry)
+            self._record_rollback(rollback_entry)
             
-            self.logger.info(f"Deleted {file_type}: {file_path}")
+            self.logger.info("Deleted %s: %s", file_type, file_path)
             self.stats.files_deleted += 1
             return True
             
         except OSError as e:
-            self.logger.error(f"Failed to delete {file_type} {file_path}: {e}")
+            self.logger.error("Failed to delete %s %s: %s", file_type, file_path, e)
             return False
     
-    def process_action(self, entry: DuplicateEntry) -> bool:
-        """Process a single action from the CSV."""
-        self.logger.info(f"Processing row {entry.row_num}: {entry.action}")
+    def _delete_both(self, entry: DuplicateEntry, prepared: PreparedOp) -> bool:
+        """Delete both the original and the duplicate file."""
+        success1 = self.execute_delete(entry.original_path, "original", prepared)
+        success2 = self.execute_delete(entry.duplicate_path, "duplicate", prepared)
+        return success1 and success2
+    
+    def _prepare_entry(self, entry: DuplicateEntry) -> Optional[PreparedOp]:
+        """Validate an entry and create its backups; safe to run in a worker thread.
         
-        try:
-            action = ActionType(entry.action)
-        except ValueError:
-            if entry.action in ["", "REVIEW_NEEDED", "Action"]:
-                self.logger.info(f"Row {entry.row_num}: No valid action ('{entry.action}') or needs review, skipping")
-                self.stats.skipped += 1
-                return True
-            else:
-                self.logger.warning(f"Unknown action '{entry.action}' for row {entry.row_num}, skipping")
-                self.stats.skipped += 1
-                return False
+        Returns None for rows without a runnable action, which process_action
+        reports itself.
+        """
+        action = entry.action_enum
+        if action is None or action is _UNKNOWN_ACTION:
+            return None
+        
+        prepared = self.validate_file_paths(entry, action)
+        if prepared.validation != ValidationResult.SUCCESS or self.dry_run:
+            return prepared
+        
+        for attr, prefix in _BACKUP_TARGETS[action]:
+            path = getattr(entry, attr)
+            if prepared.stats[path] is None:
+                continue  # execute_* reports missing files
+            if prefix == "hardlink":
+                source = entry.duplicate_path if attr == "original_path" else entry.original_path
+                prepared.source_backed = self._source_preserves(source, path, prepared)
+                if prepared.source_backed:
+                    continue
+            backup = self._ensure_backup(path, prefix)
+            if backup is not None:
+                prepared.backups[path] = backup
+        return prepared
+    
+    def process_action(self, entry: DuplicateEntry, prepared: Optional[PreparedOp] = None) -> bool:
+        """Process a single action from the CSV.
+        
+        `prepared` carries the validation result and staged backups when the
+        entry already went through _prepare_entry.
+        """
+        self.logger.info("Processing row %d: %s", entry.row_num, entry.action)
+        
+        action = entry.action_enum
+        if action is None:
+            self.logger.info("Row %d: No valid action ('%s') or needs review, skipping", entry.row_num, entry.action)
+            self.stats.skipped += 1
+            return True
+        if action is _UNKNOWN_ACTION:
+            self.logger.warning("Unknown action '%s' for row %d, skipping", entry.action, entry.row_num)
+            self.stats.skipped += 1
+            return False
         
         # Validate file paths and permissions
-        validation_result = self.validate_file_paths(entry, action)
+        if prepared is None:
+            prepared = self.validate_file_paths(entry, action)
+        validation_result = prepared.validation
         
         if validation_result == ValidationResult.ERROR:
-            self.logger.error(f"Validation failed for row {entry.row_num}, skipping")
+            self.logger.error("Validation failed for row %d, skipping", entry.row_num)
             self.stats.errors += 1
             return False
         elif validation_result == ValidationResult.CROSS_DEVICE:
-            self.logger.warning(f"Cross-device hard link attempted, skipping row {entry.row_num}")
+            self.logger.warning("Cross-device hard link attempted, skipping row %d", entry.row_num)
             self.stats.skipped += 1
             return False
         
         # Execute the appropriate action
-        success = False
-        orig_path = entry.original_path
-        dup_path = entry.duplicate_path
-        
-        if action == ActionType.SOFTLINK_ORIGINAL:
-            # Keep duplicate, link original to it
-            success = self.execute_soft_link(dup_path, orig_path, "original")
-        elif action == ActionType.SOFTLINK_DUPLICATE:
-            # Keep original, link duplicate to it
-            success = self.execute_soft_link(orig_path, dup_path, "duplicate")
-        elif action == ActionType.HARDLINK_ORIGINAL:
-            # Keep duplicate, hard link original to it
-            success = self.execute_hard_link(dup_path, orig_path, "original")
-        elif action == ActionType.HARDLINK_DUPLICATE:
-            # Keep original, hard link duplicate to it
-            success = self.execute_hard_link(orig_path, dup_path, "duplicate")
-        elif action == ActionType.DELETE_ORIGINAL:
-            # Delete original, keep duplicate
-            success = self.execute_delete(orig_path, "original")
-        elif action == ActionType.DELETE_DUPLICATE:
-            # Delete duplicate, keep original
-            success = self.execute_delete(dup_path, "duplicate")
-        elif action == ActionType.DELETE_BOTH:
-            # Delete both files
-            success1 = self.execute_delete(orig_path, "original")
-            success2 = self.execute_delete(dup_path, "duplicate")
-            success = success1 and success2
+        success = self._dispatch[action](entry, prepared)
         
         if success:
             self.stats.processed_rows += 1
@@ -455,101 +1031,185 @@ class DuplicateFileExecutor:
         
         return success
     
-    def parse_csv_file(self, csv_file: Path) -> List[DuplicateEntry]:
-        """Parse CSV file and return list of duplicate entries."""
+    def _process_batch_parallel(self, batch: List[DuplicateEntry]):
+        """Process a batch with validation and backups spread over the worker pool.
+        
+        Entries whose paths appear in no other entry of the batch (compared
+        by canonical path) and which are not symlinks are independent: runs
+        of them are prepared concurrently, then their links and deletions
+        are applied serially in CSV order. Any other entry ends the current
+        run and is processed on its own, so it sees the result of every
+        operation before it.
+        """
+        keys = [(self._canonical(e.original_path), self._canonical(e.duplicate_path))
+                for e in batch]
+        path_uses = Counter(p for pair in keys for p in set(pair))
+        
+        run: List[DuplicateEntry] = []
+        
+        def flush_run():
+            for entry, prepared in zip(run, self._pool.map(self._prepare_entry, run)):
+                self.process_action(entry, prepared)
+            run.clear()
+        
+        for entry, (orig_key, dup_key) in zip(batch, keys):
+            independent = (
+                path_uses[orig_key] == 1 and path_uses[dup_key] == 1
+                and not os.path.islink(entry.original_path)
+                and not os.path.islink(entry.duplicate_path)
+            )
+            if independent:
+                run.append(entry)
+            else:
+                flush_run()
+                self.process_action(entry)
+        flush_run()
+    
+    def _detect_delimiter(self, f) -> str:
+        """Return the CSV delimiter: the configured one, ',' or a sniffed guess.
+        
+        Sniffing is only needed for non-comma exports, so it is skipped when
+        the header line already contains a comma.
+        """
+        if self.delimiter:
+            return self.delimiter
+        
+        first_line = f.readline()
+        f.seek(0)
+        if ',' in first_line:
+            return ','
+        
+        sample = f.read(4096)
+        f.seek(0)
+        return csv.Sniffer().sniff(sample, delimiters=',;\t').delimiter
+    
+    def iter_csv_file(self, csv_file: Path) -> Iterator[DuplicateEntry]:
+        """Parse CSV file, yielding one duplicate entry per valid row."""
         if not csv_file.exists():
-            self.logger.error(f"CSV file not found: {csv_file}")
+            self.logger.error("CSV file not found: %s", csv_file)
             # Show available CSV files
             csv_files = list(csv_file.parent.glob("*.csv"))
             if csv_files:
                 self.logger.info("Available CSV files:")
                 for f in csv_files:
-                    self.logger.info(f"  {f.name}")
+                    self.logger.info("  %s", f.name)
             else:
                 self.logger.info("No CSV files found in current directory")
-            return []
+            return
+        
+        parsed = 0
+        
+        # Pool repeated column values: folders, sizes and flags recur on
+        # every sibling row, so keep one string object per distinct value
+        pool: Dict[str, str] = {}
+        
+        def pooled(value: str) -> str:
+            return pool.setdefault(value, value)
+        
+        _s = str.strip
         
-        entries = []
         try:
             with open(csv_file, 'r', encoding='utf-8', newline='') as f:
-                # Try to detect delimiter
-                sample = f.read(1024)
-                f.seek(0)
-                
-                dialect = csv.Sniffer().sniff(sample, delimiters=',;\t')
-                reader = csv.reader(f, dialect)
+                reader = csv.reader(f, 'excel', delimiter=self._detect_delimiter(f))
                 
                 for row_num, row in enumerate(reader, 1):
                     # Skip header rows and summary rows
                     if row_num <= 2:
-                        self.logger.info(f"Skipping row {row_num} (header/summary)")
+                        self.logger.info("Skipping row %d (header/summary)", row_num)
                         continue
                     
                     # Skip empty rows
                     if not any(row) or len(row) < 10:
                         if any(row):  # Only warn if row has some content but insufficient columns
-                            self.logger.warning(f"Row {row_num} has insufficient columns, skipping")
+                            self.logger.warning("Row %d has insufficient columns, skipping", row_num)
                         continue
                     
+                    # Pad a missing NOTES column so every field can be indexed directly
+                    if len(row) < _CSV_COLUMNS:
+                        row += [""] * (_CSV_COLUMNS - len(row))
+                    
                     # Parse row (accounting for empty first column)
                     try:
                         entry = DuplicateEntry(
                             row_num=row_num,
-                            original_folder=row[1].strip() if len(row) > 1 else "",
-                            original_file=row[2].strip() if len(row) > 2 else "",
-                            duplicate_folder=row[3].strip() if len(row) > 3 else "",
-                            duplicate_file=row[4].strip() if len(row) > 4 else "",
-                            size=row[5].strip() if len(row) > 5 else "",
-                            hash_value=row[6].strip() if len(row) > 6 else "",
-                            keep_orig=row[7].strip() if len(row) > 7 else "",
-                            keep_dup=row[8].strip() if len(row) > 8 else "",
-                            action=row[9].strip() if len(row) > 9 else "",
-                            notes=row[10].strip() if len(row) > 10 else ""
+                            original_folder=pooled(_s(row[1])),
+                            original_file=_s(row[2]),
+                            duplicate_folder=pooled(_s(row[3])),
+                            duplicate_file=_s(row[4]),
+                            size=pooled(_s(row[5])),
+                            hash_value=pooled(_s(row[6])),
+                            keep_orig=pooled(_s(row[7])),
+                            keep_dup=pooled(_s(row[8])),
+                            action=sys.intern(_s(row[9])),
+                            notes=_s(row[10])
                         )
                         
                         # Debug output
                         if self.verbose:
-                            self.logger.debug(f"Row {row_num} parsed: orig='{entry.original_path}' dup='{entry.duplicate_path}' action='{entry.action}'")
+                            self.logger.debug("Row %d parsed: orig='%s' dup='%s' action='%s'", row_num, entry.original_path, entry.duplicate_path, entry.action)
                         
-                        entries.append(entry)
+                        parsed += 1
                         self.stats.total_rows += 1
                         
                         # Progress indicator
                         if self.stats.total_rows % 50 == 0:
-                            self.logger.info(f"Parsed {self.stats.total_rows} rows...")
+                            self.logger.info("Parsed %d rows...", self.stats.total_rows)
                             
                     except Exception as e:
-                        self.logger.error(f"Error parsing row {row_num}: {e}")
+                        self.logger.error("Error parsing row %d: %s", row_num, e)
                         continue
+                    
+                    yield entry
                         
         except Exception as e:
-            self.logger.error(f"Error reading CSV file {csv_file}: {e}")
-            return []
+            self.logger.error("Error reading CSV file %s: %s", csv_file, e)
+            return
         
-        self.logger.info(f"Successfully parsed {len(entries)} entries from CSV")
-        return entries
+        self.logger.info("Successfully parsed %d entries from CSV", parsed)
     
     def save_rollback_data(self):
-        """Save rollback data to JSON file."""
-        if not self.rollback_entries and not self.dry_run:
+        """Close the rollback journal and convert it into the rollback JSON file.
+        
+        Journal lines are copied into the "operations" array one at a time,
+        so the full operation list is never rebuilt in memory.
+        """
+        self._close_rollback_journal()
+        
+        if not self.rollback_count and not self.dry_run:
             return
         
-        rollback_data = {
+        header = {
             "timestamp": datetime.now().isoformat(),
             "dry_run": self.dry_run,
-            "backup_directory": str(self.backup_dir),
-            "operations": [asdict(entry) for entry in self.rollback_entries]
+            "backup_directory": str(self.backup_dir)
         }
         
         try:
-            with open(self.rollback_file, 'w', encoding='utf-8') as f:
-                json.dump(rollback_data, f, indent=2, ensure_ascii=False)
-            self.logger.info(f"Rollback data saved to: {self.rollback_file}")
+            with open(self.rollback_file, 'w', encoding='utf-8') as out:
+                out.write("{\n")
+                for key, value in header.items():
+                    out.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+                out.write('  "operations": [')
+                
+                separator = "\n    "
+                if not self.dry_run:
+                    with open(self.rollback_journal, 'r', encoding='utf-8') as journal:
+                        for line in journal:
+                            line = line.strip()
+                            if line:
+                                out.write(separator + line)
+                                separator = ",\n    "
+                
+                out.write("\n  ]\n}\n")
+            self.logger.info("Rollback data saved to: %s", self.rollback_file)
         except Exception as e:
-            self.logger.error(f"Failed to save rollback data: {e}")
+            self.logger.error("Failed to save rollback data: %s", e)
+            if not self.dry_run:
+                self.logger.error("Rollback journal is still available: %s", self.rollback_journal)
     
     def show_final_statistics(self):
         """Display final processing statistics."""
+        self._flush_log()
         print("\n" + "=" * 60)
         print("DUPLICATE FILE PROCESSING COMPLETE")
         print("=" * 60)
@@ -568,6 +1228,7 @@ class DuplicateFileExecutor:
             print(f"  Backup directory: {self.backup_dir}")
             print(f"  Log file: {self.log_file}")
             print(f"  Rollback data: {self.rollback_file}")
+            print(f"  Rollback journal: {self.rollback_journal}")
             print(f"\nTo rollback operations:")
             print(f"  python rollback_duplicates.py {self.rollback_file}")
         else:
@@ -576,24 +1237,60 @@ class DuplicateFileExecutor:
         
         print("\n" + "=" * 60)
     
+    def _process_csv(self, csv_file: Path) -> bool:
+        """Process all CSV entries; returns False if the file had none."""
+        # Stream the CSV in fixed-size batches so memory use stays bounded
+        entries = self.iter_csv_file(csv_file)
+        found_entries = False
+        while True:
+            batch = list(islice(entries, _BATCH_SIZE))
+            if not batch:
+                break
+            found_entries = True
+            # The batch may run long; write out what the last one logged
+            self._flush_log()
+            
+            try:
+                # Probe the batch's paths up front; validation reads from the cache
+                self._prefetch_stats(batch)
+                
+                if self._pool is not None:
+                    self._process_batch_parallel(batch)
+                else:
+                    for entry in batch:
+                        self.process_action(entry)
+            finally:
+                # Directory fds live for one batch, which groups rows by folder
+                self._close_dir_fds()
+            
+            # Bound what a crash can lose from the rollback journal
+            if self._rollback_fp is not None:
+                self._rollback_fp.flush()
+        
+        return found_entries
+    
     def execute(self, csv_file: Path) -> int:
         """Main execution method."""
-        self.logger.info(f"Processing CSV file: {csv_file}")
+        self.logger.info("Processing CSV file: %s", csv_file)
         
         # Check prerequisites
         if not self.check_prerequisites():
             return 1
         
-        # Parse CSV file
-        entries = self.parse_csv_file(csv_file)
-        if not entries:
+        if self.jobs > 1:
+            self._pool = ThreadPoolExecutor(max_workers=self.jobs)
+        try:
+            found_entries = self._process_csv(csv_file)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        
+        if not found_entries:
             self.logger.error("No valid entries found in CSV file")
+            self._close_rollback_journal()
             return 1
         
-        # Process all entries
-        for entry in entries:
-            self.process_action(entry)
-        
         # Save rollback data
         self.save_rollback_data()
         
@@ -602,13 +1299,20 @@ class DuplicateFileExecutor:
         
         # Return appropriate exit code
         if self.stats.errors > 0:
-            self.logger.warning(f"Completed with {self.stats.errors} errors")
+            self.logger.warning("Completed with %d errors", self.stats.errors)
             return 2
         else:
             self.logger.info("All operations completed successfully")
             return 0
 
 
+def _delimiter_arg(value: str) -> str:
+    """argparse type for --delimiter: csv.reader needs exactly one character."""
+    if len(value) != 1:
+        raise argparse.ArgumentTypeError(f"must be a single character, got {value!r}")
+    return value
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -657,10 +1361,41 @@ Supported Actions:
         help='Show detailed output for all operations'
     )
     
+    parser.add_argument(
+        '--delimiter',
+        type=_delimiter_arg,
+        help='CSV field delimiter (default: auto-detect among , ; and tab)'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=_DEFAULT_JOBS,
+        help=f'Worker threads for validation and backups, 1 = fully serial (default: {_DEFAULT_JOBS})'
+    )
+    
+    parser.add_argument(
+        '--sync-rollback',
+        action='store_true',
+        help='fdatasync the rollback journal after every operation (crash-safe, slower)'
+    )
+    
+    parser.add_argument(
+        '--paranoid-hardlink-backup',
+        action='store_true',
+        help='Also compare three 64 KiB content samples before using the kept file as the backup '
+             'of a hard link target. Still a heuristic: differences outside the samples are missed, '
+             'and the target\'s own bytes are then lost. By default only the CSV Size/Hash and the '
+             'file sizes are checked'
+    )
+    
     args = parser.parse_args()
     
     # Create executor and run
-    executor = DuplicateFileExecutor(dry_run=args.dry_run, verbose=args.verbose)
+    executor = DuplicateFileExecutor(dry_run=args.dry_run, verbose=args.verbose,
+                                     delimiter=args.delimiter, jobs=args.jobs,
+                                     sync_rollback=args.sync_rollback,
+                                     paranoid_hardlink_backup=args.paranoid_hardlink_backup)
     return executor.execute(args.csv_file)
 
 
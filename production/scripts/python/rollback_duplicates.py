@@ -10,6 +10,7 @@ by the duplicate_executor.py script using the rollback JSON data.
 
 USAGE:
 python rollback_duplicates.py <rollback_file.json> [--dry-run] [--verbose]
+python rollback_duplicates.py <backup_dir>/duplicate_rollback.ndjson  (interrupted sessions)
 
 SAFETY FEATURES:
 - Dry run mode to preview rollback actions
@@ -23,17 +24,343 @@ Date: August 2025
 """
 
 import argparse
+import errno
 import json
 import logging
+import os
+import re
 import shutil
 import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 from dataclasses import dataclass
 
+try:
+    import orjson  # Optional: faster decoding of large rollback files
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Read size for streaming the rollback JSON
+_READ_CHUNK = 1 << 20
+
+
+def _open_sequential(path: Path):
+    """Open a rollback file for one front-to-back pass.
+    
+    The buffer matches _READ_CHUNK and the kernel is told to read ahead
+    aggressively, so large files arrive in few, large reads.
+    """
+    f = open(path, 'r', encoding='utf-8', buffering=_READ_CHUNK)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Only a hint; e.g. unsupported on this filesystem
+    return f
+
+
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Characters that cannot follow a complete value but can continue a number
+# cut at a chunk boundary ("12." + "5", "1e" + "3")
+_NUMBER_CONTINUATION = '.eE'
+
+
+class _JsonStream:
+    """Minimal incremental reader over a JSON text file.
+    
+    Values are decoded one at a time with the json module's C scanner,
+    reading more of the file only when the current value is incomplete,
+    so the whole document is never held in memory.
+    """
+    
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.scan_once = json.JSONDecoder().scan_once
+    
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer; False at end of file."""
+        chunk = self.f.read(_READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            self.pos = _JSON_WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, chars: str) -> str:
+        """Consume and return the next character, which must be one of chars."""
+        c = self.peek()
+        if not c or c not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return c
+    
+    def value(self) -> Any:
+        """Decode the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.scan_once(self.buf, self.pos)
+            except StopIteration as e:
+                if self._fill():
+                    continue
+                raise json.JSONDecodeError("Expecting value", self.buf, e.value) from None
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if (end == len(self.buf) or self.buf[end] in _NUMBER_CONTINUATION) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(stream: _JsonStream) -> Iterator[Any]:
+    """Yield the elements of a non-empty array whose '[' was just consumed.
+    
+    The common case (element and separator within the buffer) is handled
+    inline; anything else goes through the stream's general methods.
+    """
+    ws = _JSON_WHITESPACE.match
+    scan_once = stream.scan_once
+    buf, pos = stream.buf, stream.pos
+    after_value = False  # True when an element was consumed but not its separator
+    
+    # The executor writes one element per line: decode whole lines with
+    # orjson until one is not a complete element (JSON strings cannot
+    # contain raw newlines, so a line that parses is exactly one element).
+    # A line longer than a read chunk means some other layout, such as a
+    # compact file; the scanner below streams that instead of buffering it.
+    if orjson is not None:
+        loads = orjson.loads
+        while True:
+            pos = ws(buf, pos).end()
+            nl = buf.find('\n', pos)
+            if nl < 0:
+                if len(buf) - pos >= _READ_CHUNK:
+                    break
+                stream.pos = pos
+                if not stream._fill():
+                    break
+                buf, pos = stream.buf, stream.pos
+                continue
+            line = buf[pos:nl].rstrip()
+            last = line[-1:]
+            if last == ',':
+                line = line[:-1]
+            try:
+                value = loads(line)
+            except ValueError:
+                break
+            yield value
+            if last == ',':
+                pos = nl
+            else:
+                pos += len(line)
+                after_value = True
+                break
+    
+    while True:
+        if not after_value:
+            pos = ws(buf, pos).end()
+            try:
+                value, end = scan_once(buf, pos)
+            except (StopIteration, json.JSONDecodeError):
+                end = len(buf)  # Incomplete or invalid; let value() decide
+            if end < len(buf) and buf[end] not in _NUMBER_CONTINUATION:
+                pos = end
+            else:
+                stream.pos = pos
+                value = stream.value()
+                buf, pos = stream.buf, stream.pos
+            yield value
+        after_value = False
+        
+        pos = ws(buf, pos).end()
+        c = buf[pos:pos + 1]
+        if c == ',':
+            pos += 1
+        elif c == ']':
+            stream.pos = pos + 1
+            return
+        else:
+            stream.pos = pos
+            if stream.expect(',]') == ']':
+                return
+            buf, pos = stream.buf, stream.pos
+
+
+def _iter_operations(f, header: Dict) -> Iterator[Dict]:
+    """Stream the "operations" array of a rollback JSON file.
+    
+    The other top-level keys are stored in header as they are passed;
+    header["operations"] is set to None once the array is found.
+    """
+    stream = _JsonStream(f)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'operations':
+            header['operations'] = None
+            stream.expect('[')
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                yield from _iter_array(stream)
+        else:
+            header[key] = stream.value()
+        if stream.expect(',}') == '}':
+            break
+    
+    if stream.peek():
+        raise json.JSONDecodeError("Extra data", stream.buf, stream.pos)
+
+
+# os.link() failures that mean "cannot hard link here", so the restore copies
+_LINK_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+
+# os.copy_file_range() failures that mean "not supported for these files"
+_COPY_RANGE_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+)
+_COPY_RANGE_CHUNK = 1 << 30
+_COPY_BUFFER = 1 << 20
+
+def _fast_copy(src: Union[str, Path], dst: Union[str, Path]):
+    """Copy file content from src to a new file dst inside the kernel.
+    
+    copy_file_range() lets reflink-capable filesystems (btrfs, XFS) clone
+    the data instead of copying it. Where it is unavailable, or stops
+    short of the source size (some filesystems return 0 without copying,
+    or report a size of 0), the remainder is copied through a large userspace buffer.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'xb') as fdst:
+        if hasattr(os, 'copy_file_range'):
+            size = os.fstat(fsrc.fileno()).st_size
+            copied = 0
+            try:
+                while copied < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_RANGE_CHUNK)
+                    if n == 0:
+                        break
+                    copied += n
+                # A zero size proves nothing (procfs-like files report 0)
+                if size and copied >= size:
+                    return
+            except OSError as e:
+                if e.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                    raise
+        # copy_file_range() advances both offsets, so this continues after
+        # anything it already copied
+        shutil.copyfileobj(fsrc, fdst, _COPY_BUFFER)
+
+def _operation_filter(operation_types: Optional[List[str]], after_timestamp: Optional[str],
+                      before_timestamp: Optional[str]) -> Callable[[Dict], bool]:
+    """Return a predicate for the --operation-type/--after/--before filters.
+    
+    One flat predicate is built per combination of active filters, so each
+    operation costs only the comparisons that apply. ISO-8601 timestamps
+    compare correctly as strings.
+    """
+    types = frozenset(operation_types or ())
+    low = after_timestamp
+    high = before_timestamp
+    
+    if types:
+        if low and high:
+            return lambda op: op.get('operation_type') in types and low < op.get('timestamp', '') < high
+        if low:
+            return lambda op: op.get('operation_type') in types and op.get('timestamp', '') > low
+        if high:
+            return lambda op: op.get('operation_type') in types and op.get('timestamp', '') < high
+        return lambda op: op.get('operation_type') in types
+    if low and high:
+        return lambda op: low < op.get('timestamp', '') < high
+    if low:
+        return lambda op: op.get('timestamp', '') > low
+    return lambda op: op.get('timestamp', '') < high
+
+
+# Whole-document decoder for journal lines
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Progress line interval for non-verbose runs
+_PROGRESS_EVERY = 1000
+
+# Operations a non-verbose dry run lists individually
+_DRY_RUN_SAMPLE = 10
+
+# Rollback worker threads; restores mostly wait on I/O
+_DEFAULT_PARALLEL = min(32, (os.cpu_count() or 1) * 4)
+
+# Console log formatter, shared by every rollback instance
+_CONSOLE_FORMATTER = logging.Formatter('%(levelname)s - %(message)s')
+
+
+# Operation kinds; DuplicateRollback dispatches on them by index
+_KIND_DELETE, _KIND_SOFTLINK, _KIND_HARDLINK, _KIND_UNKNOWN, _KIND_MALFORMED = range(5)
+_KINDS = {'delete': _KIND_DELETE, 'softlink': _KIND_SOFTLINK, 'hardlink': _KIND_HARDLINK}
+
+
+class OpRecord(NamedTuple):
+    """A rollback operation, parsed once before the rollback starts."""
+    kind: int
+    operation_type: str
+    original: Optional[str]
+    backup: Optional[str]
+    target: Optional[str]
+    source_backed: bool
+
+
+def _to_record(operation: Dict) -> OpRecord:
+    """Build the OpRecord for one operation from the rollback data.
+    
+    Operations lacking a path their kind needs become _KIND_MALFORMED.
+    """
+    operation_type = operation.get('operation_type', '')
+    kind = _KINDS.get(operation_type, _KIND_UNKNOWN)
+    original = operation.get('original_path')
+    backup = operation.get('backup_path')
+    target = operation.get('target_path')
+    if kind != _KIND_UNKNOWN and not (backup and (original if kind == _KIND_DELETE else target)):
+        kind = _KIND_MALFORMED
+    return OpRecord(
+        kind,
+        operation_type,
+        original or None,
+        backup or None,
+        target or None,
+        # A hard link whose backup is the kept file itself
+        kind == _KIND_HARDLINK and backup == original,
+    )
+
+
+@dataclass(slots=True)
 class RollbackStats:
     """Statistics for rollback operations."""
     total_operations: int = 0
@@ -42,13 +369,138 @@ class RollbackStats:
     skipped_operations: int = 0
 
 
+class PathCache:
+    """Short-lived cache of existence and is-directory checks.
+    
+    Entries expire after `ttl` seconds, missing paths after `negative_ttl`;
+    paths the rollback itself modifies are invalidated explicitly. A miss
+    also records whether the parent directory exists, so the other files
+    of a missing backup directory are answered without a stat() each.
+    """
+    
+    def __init__(self, ttl: float = 1.0, negative_ttl: float = 5.0):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._exists: Dict[str, Tuple[bool, float]] = {}
+        self._is_dir: Dict[str, Tuple[bool, float]] = {}
+    
+    def _lookup(self, cache: Dict[str, Tuple[bool, float]], key: str, check: Callable[[str], bool]) -> bool:
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit is not None and now - hit[1] < self.ttl:
+            return hit[0]
+        result = check(key)
+        cache[key] = (result, now)
+        return result
+    
+    def exists(self, path: Union[str, Path], remember_missing: bool = True) -> bool:
+        """Return whether path exists.
+        
+        With remember_missing=False a miss is not cached, for checks made
+        before the restores that may still create the path.
+        """
+        key = str(path)
+        now = time.monotonic()
+        hit = self._exists.get(key)
+        if hit is not None and now - hit[1] < (self.ttl if hit[0] else self.negative_ttl):
+            return hit[0]
+        
+        # Nothing exists below a missing directory
+        parent = os.path.dirname(key)
+        parent_hit = self._exists.get(parent)
+        if parent_hit is not None and not parent_hit[0] and now - parent_hit[1] < self.negative_ttl:
+            self._exists[key] = parent_hit
+            return False
+        
+        result = os.path.exists(key)
+        if not result and not remember_missing:
+            return False
+        self._exists[key] = (result, now)
+        if not result and parent and parent != key:
+            self.exists(parent)
+        return result
+    
+    def is_dir(self, path: Union[str, Path]) -> bool:
+        return self._lookup(self._is_dir, str(path), os.path.isdir)
+    
+    def mark_dir(self, path: Union[str, Path]):
+        """Record a directory that was just created."""
+        now = time.monotonic()
+        self._is_dir[str(path)] = (True, now)
+        self._exists[str(path)] = (True, now)
+    
+    def invalidate(self, path: Union[str, Path]):
+        """Forget a path and its parent after they were modified."""
+        for key in (str(path), os.path.dirname(str(path))):
+            self._exists.pop(key, None)
+            self._is_dir.pop(key, None)
+
+
+class BatchedStreamHandler(logging.StreamHandler):
+    """Console handler that collects formatted lines and writes them together.
+    
+    Pending lines go out as one write once `capacity` of them have
+    accumulated, or with the first record logged `interval` seconds after
+    the last write. A record at `flush_level` (at most ERROR) writes out
+    itself and everything before it at once. The interval is only checked
+    on logging, so callers flush before slow steps (see
+    DuplicateRollback._flush_log).
+    """
+    
+    def __init__(self, stream=None, capacity: int = 256, interval: float = 0.5,
+                 flush_level: int = logging.WARNING):
+        super().__init__(stream)
+        self.capacity = capacity
+        self.interval = interval
+        self.flush_level = flush_level
+        self._pending: List[str] = []
+        self._last_flush = time.monotonic()
+    
+    def emit(self, record):
+        try:
+            self._pending.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        
+        if (len(self._pending) >= self.capacity or record.levelno >= min(self.flush_level, logging.ERROR)
+                or time.monotonic() - self._last_flush >= self.interval):
+            self.flush()
+    
+    def flush(self):
+        with self.lock:
+            if self._pending:
+                self.stream.write(self.terminator.join(self._pending) + self.terminator)
+                self._pending.clear()
+            super().flush()
+            self._last_flush = time.monotonic()
+
+
 class DuplicateRollback:
     """Utility class for rolling back duplicate file operations."""
     
-    def __init__(self, dry_run: bool = False, verbose: bool = False):
+    def __init__(self, dry_run: bool = False, verbose: bool = False, move_backups: bool = True,
+                 parallel: int = _DEFAULT_PARALLEL, preserve_metadata: bool = True,
+                 group_by_dir: bool = True):
         self.dry_run = dry_run
         self.verbose = verbose
+        self.preserve_metadata = preserve_metadata
+        self.group_by_dir = group_by_dir
+        self.move_backups = move_backups
+        self.parallel = max(1, parallel)
+        self._real_dirs: Dict[str, str] = {}
         self.stats = RollbackStats()
+        self.path_cache = PathCache()
+        # Parent directories already created by _create_parents()
+        self._created_parents: set = set()
+        # Handlers indexed by OpRecord.kind
+        self._dispatch = (
+            self.rollback_delete_operation,
+            self.rollback_link_operation,
+            self.rollback_link_operation,
+            self._rollback_unknown,
+            self._rollback_malformed,
+        )
         
         # Setup logging
         self._setup_logging()
@@ -56,153 +508,399 @@ class DuplicateRollback:
     def _setup_logging(self):
         """Initialize logging configuration."""
         log_level = logging.DEBUG if self.verbose else logging.INFO
+        self.logger = logging.getLogger('DuplicateRollback')
         
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        formatter = logging.Formatter('%(levelname)s - %(message)s')
-        console_handler.setFormatter(formatter)
+        # The logger level (not only the handler's) filters debug calls
+        # before a record is built
+        self.logger.setLevel(log_level)
         
-        # Configure logger
-        self.logger = logging.getLogger('DuplicateRollback')
-        self.logger.setLevel(logging.DEBUG)
-        self.logger.addHandler(console_handler)
+        if self.logger.handlers:
+            # Logger already configured by an earlier instance; only adjust verbosity
+            for handler in self.logger.handlers:
+                handler.setLevel(log_level)
+        else:
+            # Console handler
+            console_handler = BatchedStreamHandler()
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(_CONSOLE_FORMATTER)
+            
+            # Records are not passed on to the root logger
+            self.logger.propagate = False
+            self.logger.addHandler(console_handler)
         
         # Log session start
         self.logger.info("=" * 50)
         self.logger.info("Duplicate File Rollback Utility")
-        self.logger.info(f"Mode: {'DRY RUN' if self.dry_run else 'EXECUTE'}")
+        self.logger.info("Mode: %s", 'DRY RUN' if self.dry_run else 'EXECUTE')
         self.logger.info("=" * 50)
     
-    def load_rollback_data(self, rollback_file: Path) -> Optional[Dict]:
-        """Load and validate rollback data from JSON file."""
+    def load_rollback_data(self, rollback_file: Path,
+                           keep: Optional[Callable[[Dict], bool]] = None) -> Optional[Dict]:
+        """Load and validate rollback data from JSON file.
+        
+        Operations are streamed from the file; when `keep` is given, only
+        the operations it accepts are retained.
+        """
         if not rollback_file.exists():
-            self.logger.error(f"Rollback file not found: {rollback_file}")
+            self.logger.error("Rollback file not found: %s", rollback_file)
             return None
         
         try:
-            with open(rollback_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if rollback_file.suffix == '.ndjson':
+                data = self._load_rollback_journal(rollback_file, keep)
+            else:
+                data = {}
+                with _open_sequential(rollback_file) as f:
+                    operations = [op for op in _iter_operations(f, data) if keep is None or keep(op)]
+                if 'operations' in data:
+                    data['operations'] = operations
             
             # Validate required fields
             required_fields = ['timestamp', 'operations']
             for field in required_fields:
                 if field not in data:
-                    self.logger.error(f"Missing required field in rollback data: {field}")
+                    self.logger.error("Missing required field in rollback data: %s", field)
                     return None
             
-            self.logger.info(f"Loaded rollback data with {len(data['operations'])} operations")
-            self.logger.info(f"Original session: {data['timestamp']}")
+            self.logger.info("Loaded rollback data with %d operations", len(data['operations']))
+            self.logger.info("Original session: %s", data['timestamp'])
             if data.get('dry_run'):
                 self.logger.info("Original session was a dry run")
             
             return data
             
         except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in rollback file: {e}")
+            self.logger.error("Invalid JSON in rollback file: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"Error reading rollback file: {e}")
+            self.logger.error("Error reading rollback file: %s", e)
             return None
     
-    def rollback_delete_operation(self, operation: Dict) -> bool:
+    def _load_rollback_journal(self, journal_file: Path,
+                               keep: Optional[Callable[[Dict], bool]] = None) -> Dict:
+        """Load an executor rollback journal (NDJSON plus .meta.json sidecar).
+        
+        The journal is written while the executor runs, so it is usable even
+        when the session was interrupted before the rollback JSON was saved.
+        """
+        meta_file = journal_file.with_suffix('.meta.json')
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        operations = []
+        # Unreadable line, pending until it is known not to be the last one
+        unreadable: Optional[Tuple[int, ValueError]] = None
+        with _open_sequential(journal_file) as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                if unreadable is not None:
+                    raise ValueError(f"Unreadable journal line {unreadable[0]}: {unreadable[1]}") from unreadable[1]
+                try:
+                    operation = _loads(line)
+                except ValueError as e:
+                    unreadable = (line_num, e)
+                    continue
+                if keep is None or keep(operation):
+                    operations.append(operation)
+        
+        if unreadable is not None:
+            # An interrupted session can leave a partial last line
+            self.logger.warning("Skipping unreadable last journal line %d", unreadable[0])
+        
+        data['operations'] = operations
+        return data
+    
+    def _flush_log(self):
+        """Write out log lines still buffered by the console handler."""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
+    def _ensure_dir(self, directory: str):
+        """Create directory and missing ancestors, stopping at the first known directory."""
+        missing = []
+        current = directory
+        while not self.path_cache.is_dir(current):
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            missing.append(current)
+            current = parent
+        
+        for path in reversed(missing):
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                if not os.path.isdir(path):
+                    raise
+            self.path_cache.mark_dir(path)
+    
+    def _create_parents(self, records: List[OpRecord]):
+        """Create the parent directories of all files to restore, once each.
+        
+        Deleted files typically share a handful of folders, so this replaces
+        a mkdir per operation with one per unique directory, shallowest first.
+        Operations whose backup is missing are skipped so no empty
+        directories are left behind for them. Those misses are not cached:
+        an earlier restore can still make a backup valid, such as the
+        target of a symlink backup.
+        """
+        parents = {
+            os.path.dirname(record.original) for record in records
+            if record.kind == _KIND_DELETE and self.path_cache.exists(record.backup, remember_missing=False)
+        }
+        for parent in sorted(parents, key=lambda p: p.count(os.sep)):
+            try:
+                self._ensure_dir(parent)
+            except OSError as e:
+                self.logger.debug("Cannot create %s up front: %s", parent, e)
+                continue
+            self._created_parents.add(parent)
+    
+    def _restore(self, backup_path: str, target_path: str, copy_only: bool = False):
+        """Put a backup back at target_path without copying data where possible.
+        
+        On the same filesystem the backup is hard linked into place (which,
+        unlike rename, never replaces an existing file) and, with
+        --move-backups, then removed from the backup directory. Otherwise,
+        or with copy_only (the backup is a live file, such as the kept file
+        of a hard link), the content is copied, and its permissions and
+        timestamps too unless --no-preserve-metadata is given.
+        """
+        if not copy_only:
+            try:
+                os.link(backup_path, target_path)
+            except OSError as e:
+                if e.errno not in _LINK_FALLBACK_ERRNOS:
+                    raise
+            else:
+                if self.move_backups:
+                    os.unlink(backup_path)
+                    self.path_cache.invalidate(backup_path)
+                self.path_cache.invalidate(target_path)
+                return
+        
+        # A copy can take long; do not leave earlier lines waiting behind it
+        self._flush_log()
+        _fast_copy(backup_path, target_path)
+        if self.preserve_metadata:
+            shutil.copystat(backup_path, target_path)
+        self.path_cache.invalidate(target_path)
+    
+    def rollback_delete_operation(self, record: OpRecord) -> bool:
         """Rollback a delete operation by restoring from backup."""
-        original_path = Path(operation['original_path'])
-        backup_path = Path(operation['backup_path'])
+        original_path = record.original
+        backup_path = record.backup
         
         if self.dry_run:
-            self.logger.info(f"[DRY-RUN] Would restore deleted file: {backup_path} -> {original_path}")
+            self.logger.info("[DRY-RUN] Would restore deleted file: %s -> %s", backup_path, original_path)
             return True
         
         try:
-            if not backup_path.exists():
-                self.logger.error(f"Backup file not found: {backup_path}")
+            if not self.path_cache.exists(backup_path):
+                self.logger.error("Backup file not found: %s", backup_path)
                 return False
             
-            if original_path.exists():
-                self.logger.warning(f"Target file already exists: {original_path}")
+            # Checked uncached: it guards against overwriting a file
+            if os.path.exists(original_path):
+                self.logger.warning("Target file already exists: %s", original_path)
                 return False
             
-            # Create parent directory if needed
-            original_path.parent.mkdir(parents=True, exist_ok=True)
+            # Create parent directory if needed (usually done up front)
+            parent = os.path.dirname(original_path)
+            if parent not in self._created_parents:
+                self._ensure_dir(parent)
             
             # Restore file from backup
-            shutil.copy2(backup_path, original_path)
+            self._restore(backup_path, original_path)
             
-            self.logger.info(f"Restored deleted file: {original_path}")
+            self.logger.debug("Restored deleted file: %s", original_path)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to restore {original_path}: {e}")
+            self.logger.error("Failed to restore %s: %s", original_path, e)
             return False
     
-    def rollback_link_operation(self, operation: Dict) -> bool:
+    def rollback_link_operation(self, record: OpRecord) -> bool:
         """Rollback a link operation by removing link and restoring original."""
-        target_path = Path(operation['target_path'])
-        backup_path = Path(operation['backup_path'])
-        operation_type = operation['operation_type']
+        target_path = record.target
+        backup_path = record.backup
+        operation_type = record.operation_type
         
         if self.dry_run:
-            self.logger.info(f"[DRY-RUN] Would rollback {operation_type}: remove link {target_path}, restore from {backup_path}")
+            self.logger.info("[DRY-RUN] Would rollback %s: remove link %s, restore from %s", operation_type, target_path, backup_path)
             return True
         
         try:
-            # Remove the link
-            if target_path.exists() or target_path.is_symlink():
-                target_path.unlink()
-            else:
-                self.logger.warning(f"Link file not found: {target_path}")
+            # Check the backup first so the link is never removed without a
+            # replacement (hard links may use the kept file as their backup)
+            if not self.path_cache.exists(backup_path):
+                self.logger.error("Backup file not found: %s", backup_path)
+                return False
+            
+            try:
+                target_st = os.lstat(target_path)
+            except FileNotFoundError:
+                target_st = None
             
-            # Restore original file from backup if backup exists
-            if backup_path.exists():
-                shutil.copy2(backup_path, target_path)
-                self.logger.info(f"Rollback {operation_type}: restored {target_path}")
+            # A hard link whose backup is the kept file itself shares its
+            # inode until rolled back and must get its own copy. Any other
+            # target sharing the backup's inode was already restored by a
+            # previous (non-moving) rollback, so there is nothing to do.
+            source_backed = record.source_backed
+            if (record.kind == _KIND_HARDLINK and not source_backed and target_st is not None
+                    and os.path.samestat(os.stat(backup_path), target_st)):
+                self.logger.debug("Rollback %s: %s already restored", operation_type, target_path)
                 return True
+            
+            # Remove the link
+            if target_st is not None:
+                os.unlink(target_path)
+                self.path_cache.invalidate(target_path)
             else:
-                self.logger.error(f"Backup file not found: {backup_path}")
-                return False
+                self.logger.warning("Link file not found: %s", target_path)
+            
+            # Restore original file from backup
+            self._restore(backup_path, target_path, copy_only=source_backed)
+            self.logger.debug("Rollback %s: restored %s", operation_type, target_path)
+            return True
                 
         except Exception as e:
-            self.logger.error(f"Failed to rollback {operation_type} for {target_path}: {e}")
+            self.logger.error("Failed to rollback %s for %s: %s", operation_type, target_path, e)
             return False
     
-    def rollback_operation(self, operation: Dict) -> bool:
+    def _rollback_unknown(self, record: OpRecord) -> bool:
+        # Counted as skipped by execute_rollback(), before any worker runs
+        self.logger.warning("Unknown operation type: %s", record.operation_type)
+        return False
+    
+    def _rollback_malformed(self, record: OpRecord) -> bool:
+        self.logger.error("Rollback %s operation is missing its paths, skipped", record.operation_type)
+        return False
+    
+    def rollback_operation(self, record: OpRecord) -> bool:
         """Rollback a single operation."""
-        operation_type = operation.get('operation_type', '')
+        return self._dispatch[record.kind](record)
+    
+    def _rollback_numbered(self, i: int, total: int, record: OpRecord) -> bool:
+        """Roll back the i-th of total operations, logging progress.
         
-        if operation_type == 'delete':
-            return self.rollback_delete_operation(operation)
-        elif operation_type in ['softlink', 'hardlink']:
-            return self.rollback_link_operation(operation)
+        Without --verbose, progress is logged every _PROGRESS_EVERY operations.
+        """
+        if self.verbose or i % _PROGRESS_EVERY == 0 or i == total:
+            self.logger.info("Rollback %d/%d: %s - %s", i, total, record.operation_type, record.original)
+        return self._dispatch[record.kind](record)
+    
+    def _count_result(self, success: bool):
+        if success:
+            self.stats.successful_rollbacks += 1
         else:
-            self.logger.warning(f"Unknown operation type: {operation_type}")
-            self.stats.skipped_operations += 1
-            return False
+            self.stats.failed_rollbacks += 1
+    
+    def _canonical(self, path: str) -> str:
+        """Return path with its directory resolved, so aliases compare equal."""
+        directory, name = os.path.split(path)
+        real_dir = self._real_dirs.get(directory)
+        if real_dir is None:
+            real_dir = self._real_dirs[directory] = os.path.realpath(directory)
+        return os.path.join(real_dir, name)
+    
+    def _path_keys(self, records: List[OpRecord]) -> List[set]:
+        """Return the canonical paths each record touches."""
+        return [
+            {self._canonical(path) for path in (record.original, record.target, record.backup) if path is not None}
+            for record in records
+        ]
+    
+    def _grouped_by_dir(self, records: List[OpRecord]) -> List[OpRecord]:
+        """Reorder records (in LIFO order) by backup and restore directory.
+        
+        Consecutive operations then resolve the same directories. This is
+        only safe while no two operations share a path, so otherwise the
+        LIFO order is returned unchanged. The sort is stable, keeping LIFO
+        order within each directory.
+        """
+        path_uses = Counter(key for op_keys in self._path_keys(records) for key in op_keys)
+        if any(count > 1 for count in path_uses.values()):
+            self.logger.debug("Operations share paths; keeping LIFO order")
+            return records
+        return sorted(records, key=lambda record: (os.path.dirname(record.backup or ''),
+                                                   os.path.dirname(record.original or record.target or '')))
+    
+    def _rollback_parallel(self, ordered: List[OpRecord]):
+        """Roll back operations (already in LIFO order) on a thread pool.
+        
+        Operations that share no path (original, target or backup) with
+        another operation are independent: runs of them are rolled back
+        concurrently. Any other operation ends the current run and is
+        rolled back on its own, so LIFO order holds wherever it matters.
+        """
+        total = len(ordered)
+        keys = self._path_keys(ordered)
+        path_uses = Counter(key for op_keys in keys for key in op_keys)
+        
+        with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+            run: List[Tuple[int, OpRecord]] = []
+            
+            def flush_run():
+                for success in pool.map(lambda item: self._rollback_numbered(item[0], total, item[1]), run):
+                    self._count_result(success)
+                run.clear()
+            
+            for i, (record, op_keys) in enumerate(zip(ordered, keys), 1):
+                if all(path_uses[key] == 1 for key in op_keys):
+                    run.append((i, record))
+                else:
+                    flush_run()
+                    self._count_result(self._rollback_numbered(i, total, record))
+            flush_run()
+    
+    def _summarize_dry_run(self, records: List[OpRecord], kinds: Counter):
+        """Preview a rollback by operation counts and the first few operations.
+        
+        Only the first _DRY_RUN_SAMPLE operations go through the dry-run
+        handlers; --verbose lists every operation instead.
+        """
+        types = Counter(record.operation_type for record in records)
+        
+        self.logger.info("Dry run of %d operations:", len(records))
+        for operation_type, count in types.most_common():
+            self.logger.info("  %s: %d", operation_type or '(none)', count)
+        
+        sample = records[:_DRY_RUN_SAMPLE]
+        self.logger.info("First %d operations to roll back (use --verbose to list all):", len(sample))
+        for record in sample:
+            self._dispatch[record.kind](record)
+        
+        # Unknown and malformed operations would fail, as in a full dry run
+        failed = kinds[_KIND_UNKNOWN] + kinds[_KIND_MALFORMED]
+        self.stats.failed_rollbacks = failed
+        self.stats.successful_rollbacks = len(records) - failed
     
     def execute_rollback(self, rollback_file: Path, 
                         operation_types: Optional[List[str]] = None,
                         after_timestamp: Optional[str] = None,
                         before_timestamp: Optional[str] = None) -> int:
         """Execute rollback operations."""
-        # Load rollback data
-        data = self.load_rollback_data(rollback_file)
+        # Load rollback data, filtering while loading so rejected operations are never kept
+        filtered = bool(operation_types or after_timestamp or before_timestamp)
+        keep = _operation_filter(operation_types, after_timestamp, before_timestamp) if filtered else None
+        data = self.load_rollback_data(rollback_file, keep)
         if not data:
             return 1
         
         operations = data['operations']
         
-        # Filter operations if criteria specified
-        if operation_types:
-            operations = [op for op in operations if op.get('operation_type') in operation_types]
-            self.logger.info(f"Filtered to {len(operations)} operations of types: {operation_types}")
-        
-        if after_timestamp:
-            operations = [op for op in operations if op.get('timestamp', '') > after_timestamp]
-            self.logger.info(f"Filtered to {len(operations)} operations after {after_timestamp}")
-        
-        if before_timestamp:
-            operations = [op for op in operations if op.get('timestamp', '') < before_timestamp]
-            self.logger.info(f"Filtered to {len(operations)} operations before {before_timestamp}")
+        if filtered:
+            criteria = []
+            if operation_types:
+                criteria.append(f"of types: {operation_types}")
+            if after_timestamp:
+                criteria.append(f"after {after_timestamp}")
+            if before_timestamp:
+                criteria.append(f"before {before_timestamp}")
+            self.logger.info("Filtered to %d operations %s", len(operations), ', '.join(criteria))
         
         if not operations:
             self.logger.info("No operations to rollback")
@@ -210,16 +908,34 @@ class DuplicateRollback:
         
         self.stats.total_operations = len(operations)
         
-        # Process operations in reverse order (LIFO)
-        self.logger.info(f"Starting rollback of {len(operations)} operations...")
+        # Parse every operation once, in reverse order (LIFO)
+        records = [_to_record(operation) for operation in reversed(operations)]
+        del data, operations  # the records replace the parsed operations
         
-        for i, operation in enumerate(reversed(operations), 1):
-            self.logger.info(f"Rollback {i}/{len(operations)}: {operation.get('operation_type')} - {operation.get('original_path')}")
-            
-            if self.rollback_operation(operation):
-                self.stats.successful_rollbacks += 1
-            else:
-                self.stats.failed_rollbacks += 1
+        if self.group_by_dir and len(records) > 1:
+            records = self._grouped_by_dir(records)
+        
+        # Tallied once here, so handlers running on worker threads never
+        # update shared statistics
+        kinds = Counter(record.kind for record in records)
+        self.stats.skipped_operations = kinds[_KIND_UNKNOWN]
+        
+        if self.dry_run and not self.verbose:
+            self._summarize_dry_run(records, kinds)
+            self.show_final_statistics()
+            return 0 if self.stats.failed_rollbacks == 0 else 2
+        
+        if not self.dry_run:
+            self._create_parents(records)
+        
+        self.logger.info("Starting rollback of %d operations...", len(records))
+        self._flush_log()
+        
+        if self.parallel > 1 and len(records) > 1:
+            self._rollback_parallel(records)
+        else:
+            for i, record in enumerate(records, 1):
+                self._count_result(self._rollback_numbered(i, len(records), record))
         
         # Show final statistics
         self.show_final_statistics()
@@ -228,6 +944,8 @@ class DuplicateRollback:
     
     def show_final_statistics(self):
         """Display final rollback statistics."""
+        # Write out buffered log lines before the summary
+        self._flush_log()
         print("\n" + "=" * 50)
         print("ROLLBACK COMPLETE")
         print("=" * 50)
@@ -261,7 +979,7 @@ Examples:
     parser.add_argument(
         'rollback_file',
         type=Path,
-        help='JSON file containing rollback data'
+        help='JSON file containing rollback data (or a session\'s .ndjson rollback journal)'
     )
     
     parser.add_argument(
@@ -295,10 +1013,46 @@ Examples:
         help='Only rollback operations before this timestamp (ISO format)'
     )
     
+    parser.add_argument(
+        '--move-backups',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Move backups back into place; with --no-move-backups the backup directory keeps a '
+             'hard link to each restored file, the same file rather than an independent copy '
+             '(default: move; backups on another filesystem are always copied and kept)'
+    )
+    
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=_DEFAULT_PARALLEL,
+        metavar='N',
+        help=f'Worker threads for independent restores, 1 = fully serial (default: {_DEFAULT_PARALLEL})'
+    )
+    
+    parser.add_argument(
+        '--preserve-metadata',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Copy permissions and timestamps along with the content when a backup has to be '
+             'copied (default: preserve)'
+    )
+    
+    parser.add_argument(
+        '--group-by-dir',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Roll back operations grouped by directory when none of them share a path '
+             '(default: group; otherwise strict LIFO order)'
+    )
+    
     args = parser.parse_args()
     
     # Create rollback utility and execute
-    rollback = DuplicateRollback(dry_run=args.dry_run, verbose=args.verbose)
+    rollback = DuplicateRollback(dry_run=args.dry_run, verbose=args.verbose,
+                                 move_backups=args.move_backups, parallel=args.parallel,
+                                 preserve_metadata=args.preserve_metadata,
+                                 group_by_dir=args.group_by_dir)
     return rollback.execute_rollback(
         args.rollback_file,
         operation_types=args.operation_type,
@@ -0,0 +1,106 @@
+"""Tests for duplicate_executor.py, run through its command line.
+
+Each test works in a throwaway HOME, since the executor keeps its backups,
+log and rollback data under ~/tmp/2delete/duplicatesHandling.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent.parent / "scripts" / "python"
+EXECUTOR = SCRIPTS / "duplicate_executor.py"
+ROLLBACK = SCRIPTS / "rollback_duplicates.py"
+
+CSV_HEADER = ",OriginalFolder,OriginalFile,DuplicateFolder,DuplicateFile,Size,Hash,KeepOrig,KeepDup,Action,NOTES\n,summary,,,,,,,,,\n"
+
+
+class ExecutorTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.home = Path(self._tmp.name)
+        self.data = self.home / "data"
+        self.data.mkdir()
+        self.env = dict(os.environ, HOME=str(self.home))
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def write_csv(self, rows, size=None):
+        """Write decision rows of (original, duplicate, action) to a CSV.
+        
+        The Size column is the original's size on disk unless `size` is given.
+        """
+        csv_file = self.home / "decisions.csv"
+        with open(csv_file, "w", encoding="utf-8") as f:
+            f.write(CSV_HEADER)
+            for original, duplicate, action in rows:
+                if size is None:
+                    row_size = os.path.getsize(original) if os.path.exists(original) else 0
+                else:
+                    row_size = size
+                f.write(f",{os.path.dirname(original)},{os.path.basename(original)},"
+                        f"{os.path.dirname(duplicate)},{os.path.basename(duplicate)},{row_size},h,1,0,{action},\n")
+        return csv_file
+    
+    def run_script(self, script, *args):
+        return subprocess.run([sys.executable, str(script), *map(str, args)], env=self.env,
+                              capture_output=True, text=True)
+    
+    @property
+    def rollback_file(self):
+        return self.home / "tmp" / "2delete" / "duplicatesHandling" / "duplicate_rollback.json"
+
+
+class SameFileTests(ExecutorTestCase):
+    def test_symlinked_folder_row_keeps_the_file(self):
+        # /data/photos/img.jpg and /data/photos_link/img.jpg are one directory entry
+        photos = self.data / "photos"
+        photos.mkdir()
+        image = photos / "img.jpg"
+        image.write_bytes(b"jpeg data")
+        (self.data / "photos_link").symlink_to(photos)
+        alias = self.data / "photos_link" / "img.jpg"
+        
+        for action in ("HARDLINK_DUPLICATE", "HARDLINK_ORIGINAL", "DELETE_DUPLICATE"):
+            with self.subTest(action=action):
+                result = self.run_script(EXECUTOR, self.write_csv([(image, alias, action)]))
+                self.assertIn("same file", result.stdout + result.stderr)
+                self.assertEqual(image.read_bytes(), b"jpeg data")
+
+
+
+class HardLinkBackupTests(ExecutorTestCase):
+    def setUp(self):
+        super().setUp()
+        # Same size, different content: only a real backup keeps the duplicate's bytes
+        self.original = self.data / "orig.txt"
+        self.duplicate = self.data / "dup.txt"
+        self.original.write_bytes(b"kept content")
+        self.duplicate.write_bytes(b"other bytes!")
+    
+    def hard_link_and_roll_back(self, **csv_options):
+        csv_file = self.write_csv([(self.original, self.duplicate, "HARDLINK_DUPLICATE")], **csv_options)
+        self.assertEqual(self.run_script(EXECUTOR, csv_file).returncode, 0)
+        self.assertEqual(self.duplicate.read_bytes(), b"kept content")
+        with open(self.rollback_file, encoding="utf-8") as f:
+            (operation,) = json.load(f)["operations"]
+        self.run_script(ROLLBACK, self.rollback_file)
+        return operation
+    
+    def test_csv_size_mismatch_forces_real_backup(self):
+        operation = self.hard_link_and_roll_back(size=999)
+        self.assertNotEqual(operation["backup_path"], str(self.original))
+        self.assertEqual(self.duplicate.read_bytes(), b"other bytes!")
+    
+    def test_matching_csv_uses_kept_file_as_backup(self):
+        operation = self.hard_link_and_roll_back()
+        self.assertEqual(operation["backup_path"], str(self.original))
+
+
+if __name__ == "__main__":
+    unittest.main()
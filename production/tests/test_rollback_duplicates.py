@@ -0,0 +1,65 @@
+"""Tests for rollback_duplicates.py."""
+
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts" / "python"))
+
+import rollback_duplicates  # noqa: E402
+
+
+def _operations(count):
+    return [
+        {"timestamp": f"2025-08-15T14:00:{i % 60:02d}", "operation_type": "delete",
+         "original_path": f"/data/dir{i % 7}/file{i}.txt", "backup_path": f"/backups/deleted_file{i}.txt_{i}"}
+        for i in range(count)
+    ]
+
+
+class CompactRollbackFileTests(unittest.TestCase):
+    """A rollback JSON without newlines between elements (e.g. `jq -c` output)."""
+    
+    CHUNK = 4096
+    
+    def setUp(self):
+        self.operations = _operations(5000)
+        self.text = json.dumps({"timestamp": "2025-08-15T14:00:00", "operations": self.operations},
+                               separators=(',', ':'))
+    
+    def _parse(self, orjson_module):
+        buffer_sizes = []
+        real_fill = rollback_duplicates._JsonStream._fill
+        
+        def fill(stream):
+            more = real_fill(stream)
+            buffer_sizes.append(len(stream.buf))
+            return more
+        
+        with mock.patch.object(rollback_duplicates, '_READ_CHUNK', self.CHUNK), \
+                mock.patch.object(rollback_duplicates, 'orjson', orjson_module), \
+                mock.patch.object(rollback_duplicates._JsonStream, '_fill', fill):
+            header = {}
+            operations = list(rollback_duplicates._iter_operations(io.StringIO(self.text), header))
+        return header, operations, max(buffer_sizes)
+    
+    def test_stdlib_parser(self):
+        header, operations, max_buffer = self._parse(None)
+        self.assertEqual(operations, self.operations)
+        self.assertEqual(header["timestamp"], "2025-08-15T14:00:00")
+        self.assertLessEqual(max_buffer, 3 * self.CHUNK)
+    
+    @unittest.skipIf(rollback_duplicates.orjson is None, "orjson not installed")
+    def test_orjson_fast_path_streams_compact_file(self):
+        # The line-based fast path must not buffer the whole single-line file
+        header, operations, max_buffer = self._parse(rollback_duplicates.orjson)
+        self.assertEqual(operations, self.operations)
+        self.assertEqual(header["timestamp"], "2025-08-15T14:00:00")
+        self.assertLessEqual(max_buffer, 3 * self.CHUNK)
+
+
+if __name__ == "__main__":
+    unittest.main()